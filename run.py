@@ -10,8 +10,10 @@ import uvicorn
 from setup import (
     setup_loggers,
     setup_database,
+    setup_middlewares,
     setup_routes,
-    setup_error_handlers
+    setup_error_handlers,
+    lifespan
 )
 
 
@@ -25,6 +27,9 @@ async def _setup(app: fastapi.FastAPI) -> None:
     _logger.info(f"Initializing database")
     await setup_database()
 
+    _logger.info(f"Initializing middlewares")
+    await setup_middlewares(app)
+
     _logger.info(f"Initializing routes")
     await setup_routes(app)
 
@@ -41,5 +46,5 @@ _logger.info(f"Successful logger and settings setup")
 _logger.info(f"Starting application with state: {settings.STATE}")
 
 # Run
-application = fastapi.FastAPI()
+application = fastapi.FastAPI(lifespan=lifespan)
 asyncio.run(_setup(application))
@@ -1,17 +1,22 @@
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
 from logging.handlers import RotatingFileHandler
+from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
 from src.app.bases.db import BaseModel
+from src.app.main.components.auth.services.auth_service import AuthServiceST
 from src.app.main.db import AsyncDatabaseManagerST
 from src.app.main.routing import project_router
 from src.core.loggers import LoggerBuilder
 from src.core.project_state import ProjectState
 from src.core.state import project_settings
 from src.core.utils.errors import supress_exception
-from src.app.main.exceptions.handlers import __handlers__
+from src.app.main.exceptions.handlers import __handler_map__
 
 
 def setup_loggers() -> logging.Logger:
@@ -48,13 +53,17 @@ def setup_loggers() -> logging.Logger:
     )
 
 
+async def setup_middlewares(app: FastAPI) -> None:
+    app.add_middleware(GZipMiddleware, minimum_size=project_settings.HTTP_GZIP_MINIMUM_SIZE)
+
+
 async def setup_routes(app: FastAPI) -> None:
     app.include_router(project_router, prefix="/api")
 
 
 async def setup_error_handlers(app: FastAPI) -> None:
-    for handler in __handlers__:
-        app.add_exception_handler(handler.__exception_cls__, handler)
+    for exception_cls, handler in __handler_map__.items():
+        app.add_exception_handler(exception_cls, handler.handle)  # Bound `handle` skips the `__call__` hop on every error
 
 
 async def setup_database() -> None:
@@ -64,6 +73,27 @@ async def setup_database() -> None:
     await setup_database_models(db_manager)
 
 
+async def shutdown_database() -> None:
+    await AsyncDatabaseManagerST().close()
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
+    auth_listeners = (
+        asyncio.create_task(AuthServiceST().listen_revocations()),
+        asyncio.create_task(AuthServiceST().listen_user_changes())
+    )
+
+    yield
+
+    for listener in auth_listeners:
+        listener.cancel()
+        with supress_exception(asyncio.CancelledError):
+            await listener
+
+    await shutdown_database()
+
+
 async def setup_database_models(db_manager: 'AsyncDatabaseManagerST') -> None:
     async with db_manager.engine.begin() as conn:
         # if project_settings.STATE != ProjectState.PRODUCTION:
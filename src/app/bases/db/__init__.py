@@ -1,5 +1,6 @@
 from .async_session_wrappers import (
     async_session_error_convert_wrapper,
+    convert_integrity_error,
     transaction_session
 )
 from .base import *
@@ -1,9 +1,10 @@
 from contextlib import asynccontextmanager
 from logging import getLogger
-from typing import AsyncGenerator, AsyncContextManager
+from typing import AsyncGenerator, AsyncContextManager, Callable
 
 from sqlalchemy.exc import IntegrityError, StatementError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import SessionTransactionOrigin
 
 from src.core.utils.errors import get_traceback_text
 
@@ -16,6 +17,8 @@ async def transaction_session(
 ) -> AsyncGenerator[AsyncSession, None]:
     """
     A context manager that ensures automatic rollback and closure of an async database session.
+    If the session already has a transaction in progress (e.g. it is reused by a nested call), the context runs in a
+    savepoint instead: its failure rolls back only its own changes, while committing is left to the owner.
 
     :param context_manager: `AsyncContextManager[AsyncSession]`
         The asynchronous context manager that provides a database session.
@@ -25,14 +28,63 @@ async def transaction_session(
     """
 
     async with context_manager as session:
-        async with session.begin():
+        if (transaction := session.sync_session.get_transaction()) is None:
+            async with session.begin():
+                yield session
+            return
+
+        if transaction.origin is SessionTransactionOrigin.AUTOBEGIN:
+            # Begun implicitly by an enclosing plain session, which never commits, so this context owns it
+            try:
+                yield session
+            except BaseException:
+                await session.rollback()
+                raise
+
+            await session.commit()
+            return
+
+        async with session.begin_nested():
             yield session
 
 
+def convert_integrity_error(
+        error: IntegrityError,
+        classify_error: Callable[[str], type[StatementError] | None]
+) -> StatementError:
+    """
+    Converts a database integrity error into a custom exception.
+
+    :param error: `IntegrityError`
+        The original integrity error.
+
+    :param classify_error: `Callable[[str], type[StatementError] | None]`
+        Function mapping a database integrity error message to a custom exception class (or `None` if unknown).
+
+    :return: `StatementError`
+        Custom exception instance, or the original error if no mapping is found.
+    """
+
+    error_cls = classify_error(str(error.orig))
+    if error_cls is None:
+        return error
+
+    _logger.debug(f"Converting db error {error.orig.__class__.__name__} to {error_cls.__name__} ({error.orig})")
+    return error_cls(
+        message=str(error),
+        statement=error.statement,
+        params=error.params,
+        orig=error.orig,
+        hide_parameters=error.hide_parameters,
+        code=error.code,
+        ismulti=error.ismulti,
+    )
+
+
 @asynccontextmanager
 async def async_session_error_convert_wrapper(
         context_manager: AsyncContextManager[AsyncSession],
-        error_mapping: dict[str, type[StatementError]]
+        classify_error: Callable[[str], type[StatementError] | None]
 ) -> AsyncGenerator[AsyncSession, None]:
     """
     A context manager that converts specific database integrity errors into custom exceptions
@@ -41,14 +93,14 @@ async def async_session_error_convert_wrapper(
     :param context_manager: `AsyncContextManager[AsyncSession]`
         The asynchronous context manager that provides a database session.
 
-    :param error_mapping: `dict[str, type[StatementError]]`
-        Dictionary mapping database integrity errors to custom exception classes.
+    :param classify_error: `Callable[[str], type[StatementError] | None]`
+        Function mapping a database integrity error message to a custom exception class (or `None` if unknown).
 
     :yield: `AsyncSession`
         The database session to be used within the context.
 
     :raises Exception:
-        - Custom exceptions mapped from `IntegrityError` based on `error_mapping`.
+        - Custom exceptions mapped from `IntegrityError` based on `classify_error`.
         - The original exception if no mapping is found.
     """
 
@@ -56,21 +108,6 @@ async def async_session_error_convert_wrapper(
         try:
             yield session
         except IntegrityError as error:
-            for key, value in error_mapping.items():
-                if key.lower() not in str(error.orig).lower():
-                    continue
-
-                _logger.debug(f"Converting db error {error.orig.__class__.__name__} to {value.__name__} ({error.orig})")
-                raise value(
-                    message=str(error),
-                    statement=error.statement,
-                    params=error.params,
-                    orig=error.orig,
-                    hide_parameters=error.hide_parameters,
-                    code=error.code,
-                    ismulti=error.ismulti,
-                )
-
-            raise error
+            raise convert_integrity_error(error, classify_error)
         finally:
             await session.close()
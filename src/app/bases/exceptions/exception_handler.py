@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from functools import wraps
 from typing import Callable, Self
 
+from fastapi.requests import Request
 from fastapi.responses import Response
 
 
@@ -50,9 +51,13 @@ class AbstractErrorHandler[_errorT: Exception](ABC):
         """
 
     @abstractmethod
-    async def handle(self, error: _errorT) -> Response:
+    async def handle(self, request: Request, error: _errorT) -> Response:
         """
         Abstract method to handle an exception.
+        Matches the signature of Starlette exception handlers, so a bound `handle` can be registered directly.
+
+        :param request: `Request`
+            The request that raised the exception.
 
         :param error: `_errorT`
             The exception to handle.
@@ -1,8 +1,9 @@
 import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, nullcontext
+from typing import AsyncContextManager
 
-from starlette.requests import Request
+from starlette.requests import HTTPConnection, Request
 
 _logger = logging.getLogger(__name__)
 
@@ -28,6 +29,15 @@ async def cancel_on_disconnect(request: Request):
             pass
 
 
+def cancel_on_disconnect_for(request: Request, timeout: float) -> AsyncContextManager:
+    """
+    Same as `cancel_on_disconnect`, but skips watching when the wrapped wait is bounded by a short timeout,
+    as the watcher task would cost more than the wait itself. Zero timeout means "wait forever", so it is watched.
+    """
+
+    return nullcontext() if 0 < timeout <= 1 else cancel_on_disconnect(request)
+
+
 async def watch_disconnect(request: Request):
     while True:
         try:
@@ -41,3 +51,25 @@ async def watch_disconnect(request: Request):
             break
         except Exception:
             raise
+
+
+def get_client_host(connection: HTTPConnection) -> str | None:
+    """
+    Returns the client host of the connection, or None if the server doesn't know it.
+    Reads the raw ASGI `client` tuple instead of building `connection.client`.
+    """
+
+    return client[0] if (client := connection.scope.get("client")) is not None else None
+
+
+def get_user_agent(connection: HTTPConnection, default: str = "unknown") -> str:
+    """
+    Returns the `User-Agent` header of the connection.
+    Scans raw ASGI headers (names are already lowercase) instead of building `connection.headers`.
+    """
+
+    for name, value in connection.scope["headers"]:
+        if name == b"user-agent":
+            return value.decode("latin-1")
+
+    return default
@@ -370,7 +370,6 @@ class BaseRepository[_modelT: BaseModel, _pkT: Any](DBPaginateable, ABC):
             .returning(self.__model_cls__)
         )
 
-        await session.commit()
         return result.scalar_one_or_none()
 
     async def _delete_by(self, session: AsyncSession, filters: dict[str, Any]) -> tuple[_modelT, ...]:
@@ -424,7 +423,6 @@ class BaseRepository[_modelT: BaseModel, _pkT: Any](DBPaginateable, ABC):
             .returning(self.__model_cls__)
         )
 
-        await session.commit()
         return result.scalar_one_or_none()
 
     async def _update_by(self, session: AsyncSession, filters: dict[str, Any], update_data: dict[str, Any]) -> _modelT | None:
@@ -473,7 +471,7 @@ class BaseRepository[_modelT: BaseModel, _pkT: Any](DBPaginateable, ABC):
         """
 
         await session.merge(model_obj)
-        await session.commit()
+        await session.flush()  # Committed by the owner of the transaction
 
     async def _create(self, session: AsyncSession, model_obj: _modelT) -> None:
         """
@@ -487,7 +485,7 @@ class BaseRepository[_modelT: BaseModel, _pkT: Any](DBPaginateable, ABC):
         """
 
         session.add(model_obj)
-        await session.commit()
+        await session.flush()  # Committed by the owner of the transaction
 
     async def _bulk_create(self, session: AsyncSession, model_objs: Sequence[_modelT]) -> None:
         """
@@ -501,7 +499,7 @@ class BaseRepository[_modelT: BaseModel, _pkT: Any](DBPaginateable, ABC):
         """
 
         session.add_all(model_objs)
-        await session.commit()
+        await session.flush()  # Committed by the owner of the transaction
 
     async def _bulk_update(self, session: AsyncSession, filters: dict[str, Any], update_data: dict[str, Any]) -> int:
         """
@@ -529,7 +527,6 @@ class BaseRepository[_modelT: BaseModel, _pkT: Any](DBPaginateable, ABC):
             .values(**update_data)
         )
         result = await session.execute(stmt)
-        await session.commit()
         return result.rowcount  # type: ignore
 
     async def _count(self, session: AsyncSession, filters: dict[str, Any]) -> int:
@@ -1,12 +1,14 @@
 from datetime import datetime
 
-from pydantic import Field
+from pydantic import Field, ConfigDict
 
 from src.app.bases.db import BaseSchema
 from src.core.utils.types import UUIDString
 
 
 class AuthSessionInternal(BaseSchema):
+    model_config = ConfigDict(frozen=True)  # Use `model_copy(update=...)` to change fields
+
     session_uuid: UUIDString
     user_id: int
     is_active: bool = True
@@ -1,17 +1,19 @@
 from datetime import datetime
 from typing import Union, Literal
-from uuid import uuid4
 
-from pydantic import Field, field_validator
+from pydantic import Field, ConfigDict, field_validator
 
 from src.app.bases.db import BaseSchema
 from src.app.main.components.auth.entities.auth_token_payload.auth_token_type import AuthTokenType
 from src.app.main.components.auth.internal_utils.jwt_tools import calculate_refresh_expire_at, calculate_access_expire_at
+from src.core.utils.identifiers import generate_uuid_string
 from src.core.utils.types import UUIDString
 
 
 class AuthTokenPayload(BaseSchema):
-    token_uuid: str = Field(default_factory=lambda: str(uuid4()))
+    model_config = ConfigDict(frozen=True)
+
+    token_uuid: str = Field(default_factory=generate_uuid_string)
     token_type: AuthTokenType
     exp: datetime
     user_id: int
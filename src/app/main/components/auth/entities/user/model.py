@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import cast
 
 from sqlalchemy import Column, Integer, String, DateTime
 
@@ -13,3 +14,8 @@ class UserModel(BaseModel):
     username = Column(String(50), unique=True, index=True)
     password = Column(String(300), nullable=False)
     created_at = Column(DateTime, default=datetime.now)
+
+    @property
+    def password_hash(self) -> str:
+        # Typed access to the loaded value, `password` is a `Column[str]` for type checkers
+        return cast(str, self.password)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import Field
+from pydantic import Field, ConfigDict
 
 from src.app.bases.db import BaseSchema
 
@@ -21,4 +21,4 @@ class UserPrivate(UserPublic):  # For private usage. Can only be shown to user-o
 
 
 class UserInternal(UserPrivate):  # For internal usage. Must not be used outside application
-    pass
+    model_config = ConfigDict(frozen=True)  # Instances are shared through auth cache
@@ -5,6 +5,8 @@ from src.app.main.exceptions import GenericApplicationHTTPException
 
 
 class AuthHTTPException(GenericApplicationHTTPException, ABC):
+    __cache_default_payload__ = True  # Auth errors are raised on every rejected request
+
     def __init__(self, **kwargs) -> None:
         kwargs.setdefault("status_code", HTTPStatus.UNAUTHORIZED)
         super().__init__(**kwargs)
@@ -0,0 +1,75 @@
+import base64
+import hashlib
+import hmac
+import os
+
+from src.core.state import project_settings
+
+SCRYPT_HASH_PREFIX = "scrypt"
+_SCRYPT_HASH_SEPARATOR = "$"
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data.encode("ascii"))
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int, dklen: int, encoding: str) -> bytes:
+    return hashlib.scrypt(password.encode(encoding=encoding), salt=salt, n=n, r=r, p=p, dklen=dklen, maxmem=128 * n * r * p * 2)
+
+
+def _parse_scrypt_hash(password_hash: str) -> tuple[int, int, int, bytes, bytes]:
+    # Raises ValueError (binascii.Error included) for malformed hashes
+    _, n, r, p, salt, key = password_hash.split(_SCRYPT_HASH_SEPARATOR)
+    return int(n), int(r), int(p), _b64decode(salt), _b64decode(key)
+
+
+def is_legacy_hash(password_hash: str) -> bool:
+    # Legacy hashes are plain unsalted sha256 hex digests
+    return not password_hash.startswith(SCRYPT_HASH_PREFIX + _SCRYPT_HASH_SEPARATOR)
+
+
+def hash_password(password: str, encoding: str = "utf-8") -> str:
+    n = project_settings.PASSWORD_SCRYPT_N
+    r = project_settings.PASSWORD_SCRYPT_R
+    p = project_settings.PASSWORD_SCRYPT_P
+    salt = os.urandom(project_settings.PASSWORD_SALT_SIZE)
+    key = _scrypt(password, salt, n, r, p, project_settings.PASSWORD_HASH_SIZE, encoding)
+
+    return _SCRYPT_HASH_SEPARATOR.join((SCRYPT_HASH_PREFIX, str(n), str(r), str(p), _b64encode(salt), _b64encode(key)))
+
+
+def verify_legacy_sha256(password: str, password_hash: str, encoding: str = "utf-8") -> bool:
+    return hmac.compare_digest(hashlib.sha256(password.encode(encoding=encoding)).hexdigest(), password_hash)
+
+
+def verify_password(password: str, password_hash: str, encoding: str = "utf-8") -> bool:
+    if is_legacy_hash(password_hash):
+        return verify_legacy_sha256(password, password_hash, encoding)
+
+    try:
+        n, r, p, salt, expected_key = _parse_scrypt_hash(password_hash)
+        actual_key = _scrypt(password, salt, n, r, p, len(expected_key), encoding)
+    except ValueError:
+        return False
+
+    return hmac.compare_digest(actual_key, expected_key)
+
+
+def needs_rehash(password_hash: str) -> bool:
+    if is_legacy_hash(password_hash):
+        return True
+
+    try:
+        n, r, p, *_ = _parse_scrypt_hash(password_hash)
+    except ValueError:  # Malformed, the same as `verify_password` treats it
+        return True
+
+    return (n, r, p) != (
+        project_settings.PASSWORD_SCRYPT_N,
+        project_settings.PASSWORD_SCRYPT_R,
+        project_settings.PASSWORD_SCRYPT_P
+    )
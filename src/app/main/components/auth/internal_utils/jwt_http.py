@@ -1,3 +1,5 @@
+import hashlib
+import time
 from http import HTTPStatus
 
 import jwt
@@ -8,10 +10,24 @@ from src.app.main.components.auth.entities.user import UserInternal, UserModel
 from src.app.main.components.auth.exceptions import TokenExpiredHTTPException, TokenInvalidHTTPException, AuthUserUnknownHTTPException
 from src.app.main.components.auth.internal_utils.jwt_tools import decode_jwt_token
 from src.app.main.components.auth.services.user.user_service import UserServiceST
+from src.core.state import project_settings
+from src.core.utils.collections import TTLCache
 from src.core.utils.types import JsonDict
 
 _user_service = UserServiceST()
 
+# Already verified and validated access token payloads, keyed by token digest.
+# This only skips signature checks: a payload says nothing about the session state, so callers must still validate it
+# against the session (AuthServiceST caches that result too, but evicts it on revocation and token rotation).
+_access_token_cache: TTLCache[bytes, AccessTokenPayload] = TTLCache(
+    maxsize=project_settings.AUTH_TOKEN_CACHE_SIZE,
+    ttl=project_settings.AUTH_TOKEN_CACHE_TTL
+)
+
+
+def get_token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 
 def decode_jwt_token_with_http_exceptions(token: str) -> JsonDict:
     try:
@@ -23,11 +39,20 @@ def decode_jwt_token_with_http_exceptions(token: str) -> JsonDict:
 
 
 def decode_access_token_with_http_exceptions(token: str) -> AccessTokenPayload:
+    cache_key = get_token_cache_key(token)
+    if (payload := _access_token_cache.get(cache_key)) is not None:
+        return payload
+
     try:
-        return AccessTokenPayload.model_validate(decode_jwt_token_with_http_exceptions(token))
+        payload = AccessTokenPayload.model_validate(decode_jwt_token_with_http_exceptions(token))
     except pydantic.ValidationError as error:
         raise TokenInvalidHTTPException(status_code=HTTPStatus.UNAUTHORIZED) from error
 
+    # Cached payload must never outlive the token itself
+    ttl = min(project_settings.AUTH_TOKEN_CACHE_TTL, payload.exp.timestamp() - time.time())
+    _access_token_cache.set(cache_key, payload, ttl=ttl)
+    return payload
+
 
 def decode_refresh_token_with_http_exceptions(token: str) -> RefreshTokenPayload:
     try:
@@ -2,6 +2,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, Union, TYPE_CHECKING
 
 import jwt
+import orjson
 
 from src.core.state import project_settings
 from src.core.utils.types import JsonDict, UUIDString
@@ -11,11 +12,12 @@ if TYPE_CHECKING:
 
 
 def create_jwt_token(*, payload: JsonDict, exp: Union[int, float]) -> str:
-    encoded_jwt = jwt.encode(
-        payload={
+    # Claims are serialized with orjson and signed directly, skipping PyJWT's stdlib json pass
+    encoded_jwt = jwt.api_jws.encode(
+        payload=orjson.dumps({
             "exp": exp,
             **payload
-        },
+        }),
         key=project_settings.SECRET_KEY,
         algorithm=project_settings.TOKEN_ENCRYPTION_ALGORITHM
     )
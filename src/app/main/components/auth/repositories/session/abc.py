@@ -1,7 +1,8 @@
-import uuid
 from abc import ABC, abstractmethod
+from typing import AsyncGenerator
 
 from src.app.main.components.auth.entities.auth_session import AuthSessionInternal
+from src.core.utils.identifiers import generate_uuid_string
 from src.core.utils.types import UUIDString
 
 
@@ -14,9 +15,10 @@ class AbstractSessionRepository(ABC):
             user_agent: str,
             session_name: str,
             access_token_uuid: UUIDString,
-            refresh_token_uuid: UUIDString
+            refresh_token_uuid: UUIDString,
+            session_uuid: UUIDString | None = None
     ) -> AuthSessionInternal:
-        """Create a new session with generated session ID"""
+        """Create a new session with given or generated session ID"""
 
     @abstractmethod
     async def get_session(self, user_id: int, session_uuid: UUIDString) -> AuthSessionInternal | None:
@@ -36,22 +38,26 @@ class AbstractSessionRepository(ABC):
 
     @abstractmethod
     async def update_session(self, updated_schema: AuthSessionInternal) -> None:
-        """Update session metadata"""
+        """Update session metadata and notify workers that cached copies of it are stale"""
 
     @abstractmethod
-    async def session_heartbeat(self, session: AuthSessionInternal) -> None:
-        """Update last_used timestamp"""
+    async def session_heartbeat(self, session: AuthSessionInternal) -> AuthSessionInternal:
+        """Update last_used timestamp and return updated session"""
 
     @abstractmethod
     async def session_heartbeat_by_id(self, user_id: int, session_uuid: UUIDString) -> AuthSessionInternal | None:
         """Update last_used timestamp by id"""
 
+    @abstractmethod
+    def listen_revoked_sessions(self) -> AsyncGenerator[UUIDString, None]:
+        """Yield uuids of sessions revoked by any worker"""
+
     @abstractmethod
     async def cleanup(self) -> None:
         """Cleanup expired sessions"""
 
     def generate_session_uuid(self) -> str:
-        return str(uuid.uuid4())
+        return generate_uuid_string()
 
     def generate_token_id(self) -> str:
-        return str(uuid.uuid4())
+        return generate_uuid_string()
@@ -1,10 +1,13 @@
-import asyncio
 import logging
 from datetime import datetime
+from typing import AsyncGenerator
+
+from pydantic import TypeAdapter
 
 from src.app.main.components.auth.entities.auth_session import AuthSessionInternal
+from src.app.main.components.auth.internal_utils.jwt_tools import calculate_refresh_expire_at
 from src.app.main.redis import RedisClientMixin
-from src.app.main.utils.redis import convert_for_redis
+from src.app.main.utils.redis import convert_for_redis, listen_channels_realtime
 from src.core.state import project_settings
 from src.core.utils.singleton import ABCSingletonMeta
 from src.core.utils.types import UUIDString
@@ -13,43 +16,92 @@ from ...services.user import UserServiceST
 
 _logger = logging.getLogger(__name__)
 _user_service = UserServiceST()
+_session_adapter: TypeAdapter[AuthSessionInternal] = TypeAdapter(AuthSessionInternal)
+_session_list_adapter: TypeAdapter[list[AuthSessionInternal]] = TypeAdapter(list[AuthSessionInternal])
 
 
 class RedisSessionRepository(RedisClientMixin, AbstractSessionRepository, metaclass=ABCSingletonMeta):
-    AUTH_USER_DATA_REDIS_KEY: str = project_settings.AUTH_REDIS_KEY + ":user:{}"
-    AUTH_USER_SESSIONS_REDIS_KEY: str = AUTH_USER_DATA_REDIS_KEY + ":sessions"
-    AUTH_USER_SESSION_REDIS_KEY: str = AUTH_USER_SESSIONS_REDIS_KEY + ":{}"
+    AUTH_USER_REDIS_KEY_PREFIX: str = project_settings.AUTH_REDIS_KEY + ":user:"
+
+    # Marks every existing session in KEYS as inactive, announces its uuid (ARGV[i + 1]) on the revocation
+    # channel (ARGV[1]) and returns how many were updated, so revoking any number of sessions costs a single round-trip
+    SOFT_DELETE_SESSIONS_SCRIPT: str = """
+        local revoked = 0
+        for i, key in ipairs(KEYS) do
+            if redis.call('EXISTS', key) == 1 then
+                redis.call('HSET', key, 'is_active', 'false')
+                redis.call('PUBLISH', ARGV[1], ARGV[i + 1])
+                revoked = revoked + 1
+            end
+        end
+        return revoked
+    """
+
+    # Bumps only "last_used" of an existing session, so heartbeats skip re-serializing the whole hash
+    HEARTBEAT_SESSION_SCRIPT: str = """
+        if redis.call('EXISTS', KEYS[1]) == 0 then
+            return 0
+        end
+        redis.call('HSET', KEYS[1], 'last_used', ARGV[1])
+        return 1
+    """
 
     def __init__(self) -> None:
         super().__init__(db=project_settings.AUTH_REDIS_DB_ID)
 
     def _get_session_key(self, user_id: int, session_uuid: UUIDString) -> str:
-        return self.AUTH_USER_SESSION_REDIS_KEY.format(user_id, session_uuid)
+        return f"{self.AUTH_USER_REDIS_KEY_PREFIX}{user_id}:sessions:{session_uuid}"
 
-    def _get_user_sessions_key(self, user_id: int) -> UUIDString:
-        return self.AUTH_USER_SESSIONS_REDIS_KEY.format(user_id)
+    def _get_user_sessions_key(self, user_id: int) -> str:
+        return f"{self.AUTH_USER_REDIS_KEY_PREFIX}{user_id}:sessions"
 
-    async def __save_session(self, session: AuthSessionInternal) -> None:
+    async def __save_session(self, session: AuthSessionInternal, *, announce: bool = False) -> None:
         redis = await self.get_redis()
 
         session_key = self._get_session_key(session.user_id, session.session_uuid)
-        await redis.hset(session_key, mapping=convert_for_redis(session.to_json_dict()))  # type: ignore
-        await redis.expire(session_key, round(session.expires_at.timestamp()))  # type: ignore
+        user_sessions_key = self._get_user_sessions_key(session.user_id)
+        expire_at = round(session.expires_at.timestamp())  # expires_at is absolute
 
-    async def __delete_session(self, user_id: int, session_uuid: UUIDString, *, soft: bool) -> bool:
-        redis = await self.get_redis()
-        session_key = self._get_session_key(user_id, session_uuid)
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.hset(session_key, mapping=convert_for_redis(session.to_json_dict()))
+            pipe.expireat(session_key, expire_at)
+            pipe.sadd(user_sessions_key, session.session_uuid)
+
+            # Index set lives as long as its longest session. GT alone never applies to a key without expiry
+            # (it counts as infinite), so NX sets the first expiry and GT only ever extends it
+            pipe.expireat(user_sessions_key, expire_at, nx=True)
+            pipe.expireat(user_sessions_key, expire_at, gt=True)
+
+            if announce:
+                # Workers drop auth info cached for the previous state of the session (e.g. rotated tokens)
+                pipe.publish(project_settings.AUTH_REVOCATION_CHANNEL, session.session_uuid)
+
+            await pipe.execute()
 
-        if not await redis.exists(session_key):
-            return False
+    async def __soft_delete_sessions(self, user_id: int, session_uuids: list[UUIDString]) -> int:
+        if len(session_uuids) == 0:
+            return 0
 
+        script = await self.get_script(self.SOFT_DELETE_SESSIONS_SCRIPT)
+        return int(await script(
+            keys=[self._get_session_key(user_id, session_uuid) for session_uuid in session_uuids],
+            args=[project_settings.AUTH_REVOCATION_CHANNEL, *session_uuids]
+        ))
+
+    async def __delete_session(self, user_id: int, session_uuid: UUIDString, *, soft: bool) -> bool:
         if soft:
             # Soft delete: update the "is_active" field to False
-            await redis.hset(session_key, "is_active", "false")  # type: ignore
-        else:
-            await redis.delete(session_key)
+            return bool(await self.__soft_delete_sessions(user_id, [session_uuid]))
+
+        redis = await self.get_redis()
+
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._get_session_key(user_id, session_uuid))
+            pipe.srem(self._get_user_sessions_key(user_id), session_uuid)
+            pipe.publish(project_settings.AUTH_REVOCATION_CHANNEL, session_uuid)
+            deleted, _, _ = await pipe.execute()
 
-        return True
+        return bool(deleted)
 
     async def __get_session(self, user_id: int, session_uuid: UUIDString) -> AuthSessionInternal | None:
         redis = await self.get_redis()
@@ -58,15 +110,31 @@ class RedisSessionRepository(RedisClientMixin, AbstractSessionRepository, metacl
         if (session_data := await redis.hgetall(session_key)) is None or len(session_data) == 0:  # type: ignore
             return None
 
-        return AuthSessionInternal.model_validate(session_data)
+        return _session_adapter.validate_python(session_data)
 
-    async def __scan_for_user_sessions(self, user_id: int) -> tuple[AuthSessionInternal, ...]:
+    async def __get_user_sessions(self, user_id: int) -> tuple[AuthSessionInternal, ...]:
         redis = await self.get_redis()
+        user_sessions_key = self._get_user_sessions_key(user_id)
+
+        # Per-user index set keeps this O(sessions) instead of scanning the whole keyspace
+        session_uuids = tuple(await redis.smembers(user_sessions_key))  # type: ignore
 
-        session_uuids = tuple(key async for key in redis.scan_iter(match=self._get_user_sessions_key(user_id)))  # type: ignore
-        sessions = await asyncio.gather(*(redis.hgetall(key) for key in session_uuids))  # type: ignore
+        if len(session_uuids) == 0:
+            return ()
 
-        return tuple(map(AuthSessionInternal.model_validate, sessions))
+        # Fetch all sessions in a single round-trip instead of one per session
+        async with redis.pipeline(transaction=False) as pipe:
+            for session_uuid in session_uuids:
+                pipe.hgetall(self._get_session_key(user_id, session_uuid))
+
+            sessions = await pipe.execute()
+
+        # Session hashes expire on their own, so drop index members that outlived them
+        if stale_uuids := [session_uuid for session_uuid, session in zip(session_uuids, sessions) if not session]:
+            await redis.srem(user_sessions_key, *stale_uuids)  # type: ignore
+
+        # Validated as one list so pydantic-core handles the whole batch in a single call
+        return tuple(_session_list_adapter.validate_python([session for session in sessions if session]))
 
     async def create_session(
             self,
@@ -75,9 +143,11 @@ class RedisSessionRepository(RedisClientMixin, AbstractSessionRepository, metacl
             user_agent: str,
             session_name: str,
             access_token_uuid: UUIDString,
-            refresh_token_uuid: UUIDString
+            refresh_token_uuid: UUIDString,
+            session_uuid: UUIDString | None = None
     ) -> AuthSessionInternal:
-        session_uuid = self.generate_session_uuid()
+        session_uuid = session_uuid if session_uuid is not None else self.generate_session_uuid()
+        now = datetime.now()
 
         session = AuthSessionInternal(
             session_uuid=session_uuid,
@@ -87,9 +157,9 @@ class RedisSessionRepository(RedisClientMixin, AbstractSessionRepository, metacl
             session_name=session_name,
             ip_address=ip_address,
             user_agent=user_agent,
-            created_at=datetime.now(),
-            last_used=datetime.now(),
-            expires_at=datetime.now()
+            created_at=now,
+            last_used=now,
+            expires_at=calculate_refresh_expire_at(now)
         )
 
         await self.__save_session(session)
@@ -99,31 +169,49 @@ class RedisSessionRepository(RedisClientMixin, AbstractSessionRepository, metacl
         return await self.__get_session(user_id, session_uuid)
 
     async def get_user_sessions(self, user_id: int) -> tuple[AuthSessionInternal, ...]:
-        return await self.__scan_for_user_sessions(user_id)
+        return await self.__get_user_sessions(user_id)
 
     async def revoke_session_by_id(self, user_id: int, session_uuid: UUIDString) -> bool:
         return await self.__delete_session(user_id, session_uuid, soft=True)
 
     async def revoke_other_sessions(self, user_id: int, keep_session_uuid: UUIDString) -> None:
-        for session in await self.get_user_sessions(user_id):
-            if session.session_uuid == keep_session_uuid:
-                continue
+        redis = await self.get_redis()
+        session_uuids = await redis.smembers(self._get_user_sessions_key(user_id))  # type: ignore
+
+        await self.__soft_delete_sessions(user_id, [
+            session_uuid
+            for session_uuid in session_uuids
+            if session_uuid != keep_session_uuid
+        ])
+
+    async def listen_revoked_sessions(self) -> AsyncGenerator[UUIDString, None]:
+        redis = await self.get_redis()
 
-            await self.__delete_session(user_id, session.session_uuid, soft=True)
+        async for message in listen_channels_realtime(redis, (project_settings.AUTH_REVOCATION_CHANNEL,)):
+            yield message["data"]
 
     async def update_session(self, updated_schema: AuthSessionInternal) -> None:
-        await self.__save_session(updated_schema)
+        await self.__save_session(updated_schema, announce=True)
 
-    async def session_heartbeat(self, session: AuthSessionInternal) -> None:
-        session.last_used = datetime.now()
-        await self.update_session(session)
+    async def session_heartbeat(self, session: AuthSessionInternal) -> AuthSessionInternal:
+        now = datetime.now()
+
+        # Coalesce frequent heartbeats: "last_used" does not need sub-resolution precision
+        if (now - session.last_used).total_seconds() < project_settings.AUTH_SESSION_HEARTBEAT_RESOLUTION:
+            return session
+
+        session = session.model_copy(update={"last_used": now})
+
+        script = await self.get_script(self.HEARTBEAT_SESSION_SCRIPT)
+        await script(keys=[self._get_session_key(session.user_id, session.session_uuid)], args=[session.last_used.isoformat()])
+
+        return session
 
     async def session_heartbeat_by_id(self, user_id: int, session_uuid: UUIDString) -> AuthSessionInternal | None:
         if (session := await self.get_session(user_id, session_uuid)) is None:
             return None
 
-        await self.session_heartbeat(session)
-        return session
+        return await self.session_heartbeat(session)
 
     async def cleanup(self) -> None:  # TODO
         pass
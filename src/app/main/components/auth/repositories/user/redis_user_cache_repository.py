@@ -0,0 +1,64 @@
+from typing import AsyncGenerator
+
+from src.app.main.components.auth.entities.user.schemas import UserInternal
+from src.app.main.redis import RedisClientMixin
+from src.app.main.utils.redis import listen_channels_realtime
+from src.core.state import project_settings
+from src.core.utils.singleton import SingletonMeta
+
+
+class RedisUserCacheRepositoryST(RedisClientMixin, metaclass=SingletonMeta):
+    """Users cache shared by all workers, so authentication on a cold worker costs a Redis GET instead of a DB query"""
+
+    AUTH_USER_REDIS_KEY_PREFIX: str = project_settings.AUTH_REDIS_KEY + ":user:"
+    ALL_USERS_CHANGED: str = "*"  # Published when the changed users are unknown (e.g. bulk updates)
+
+    def __init__(self) -> None:
+        super().__init__(db=project_settings.AUTH_REDIS_DB_ID)
+
+    def _get_user_key(self, user_id: int | str) -> str:
+        return f"{self.AUTH_USER_REDIS_KEY_PREFIX}{user_id}:info"
+
+    async def get_user(self, user_id: int) -> UserInternal | None:
+        redis = await self.get_redis()
+
+        if (user_data := await redis.get(self._get_user_key(user_id))) is None:
+            return None
+
+        return UserInternal.model_validate_json(user_data)
+
+    async def set_user(self, user: UserInternal) -> None:
+        redis = await self.get_redis()
+        await redis.set(self._get_user_key(user.id), user.model_dump_json(), ex=project_settings.AUTH_USER_REDIS_CACHE_TTL)
+
+    async def delete_user(self, user_id: int) -> None:
+        redis = await self.get_redis()
+        await redis.delete(self._get_user_key(user_id))
+
+    async def invalidate_user(self, user_id: int) -> None:
+        redis = await self.get_redis()
+
+        # Workers drop their in-process copies when the announcement arrives
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._get_user_key(user_id))
+            pipe.publish(project_settings.AUTH_USER_CHANGED_CHANNEL, user_id)
+            await pipe.execute()
+
+    async def invalidate_all_users(self) -> None:
+        redis = await self.get_redis()
+
+        keys = [key async for key in redis.scan_iter(match=self._get_user_key("*"))]
+        async with redis.pipeline(transaction=True) as pipe:
+            if len(keys) != 0:
+                pipe.delete(*keys)
+
+            pipe.publish(project_settings.AUTH_USER_CHANGED_CHANNEL, self.ALL_USERS_CHANGED)
+            await pipe.execute()
+
+    async def listen_changed_users(self) -> AsyncGenerator[int | None, None]:
+        """Yields ids of changed users, or None if any cached user may be stale"""
+
+        redis = await self.get_redis()
+
+        async for message in listen_channels_realtime(redis, (project_settings.AUTH_USER_CHANGED_CHANNEL,)):
+            yield None if message["data"] == self.ALL_USERS_CHANGED else int(message["data"])
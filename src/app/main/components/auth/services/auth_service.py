@@ -1,5 +1,7 @@
+import asyncio
+import logging
+import time
 from http import HTTPStatus
-from uuid import uuid4
 
 from src.app.main.components.auth.entities.auth_info import AuthInfo
 from src.app.main.components.auth.entities.auth_session import AuthSessionInternal
@@ -12,34 +14,89 @@ from src.app.main.components.auth.exceptions import (
     SuspiciousActivityHTTPException,
     AuthUserUnknownHTTPException
 )
-from src.app.main.components.auth.internal_utils.jwt_tools import create_access_token, create_refresh_token
+from src.app.main.components.auth.internal_utils.jwt_http import get_token_cache_key, decode_access_token_with_http_exceptions
+from src.app.main.components.auth.internal_utils.jwt_tools import (
+    create_access_token,
+    create_refresh_token,
+    calculate_refresh_expire_at
+)
+from src.app.main.components.auth.repositories.user.redis_user_cache_repository import RedisUserCacheRepositoryST
 from src.app.main.components.auth.services.session.session_service import SessionServiceST
 from src.app.main.components.auth.services.user.user_service import UserServiceST
 from src.app.main.db.exceptions import UniqueConstraintFailed
+from src.core.state import project_settings
+from src.core.utils.async_tools import create_detached_task
+from src.core.utils.collections import TTLCache
+from src.core.utils.identifiers import generate_uuid_string
 from src.core.utils.singleton import SingletonMeta
 from src.core.utils.types import UUIDString
 
+_logger = logging.getLogger(__name__)
+
 
 class AuthServiceST(metaclass=SingletonMeta):
     def __init__(self) -> None:
         self._session_service: SessionServiceST = SessionServiceST()
         self._user_service: UserServiceST = UserServiceST()
+        self._user_cache_repository: RedisUserCacheRepositoryST = RedisUserCacheRepositoryST()
+        self._user_cache: TTLCache[int, UserInternal] = TTLCache(
+            maxsize=project_settings.AUTH_USER_CACHE_SIZE,
+            ttl=project_settings.AUTH_USER_CACHE_TTL
+        )
+        self._auth_info_cache: TTLCache[bytes, AuthInfo] = TTLCache(
+            maxsize=project_settings.AUTH_INFO_CACHE_SIZE,
+            ttl=project_settings.AUTH_INFO_CACHE_TTL
+        )
+        self._pending_authentications: dict[bytes, asyncio.Task[AuthInfo]] = {}
 
     async def _log_security_event(self) -> None:  # TODO
         pass
 
     async def _get_user_by_id(self, user_id: int) -> UserInternal:
+        if (user := self._user_cache.get(user_id)) is not None:
+            return user
+
+        # Sessions already live in Redis, so a warm shared cache keeps the whole auth path off the database
+        if (user := await self._user_cache_repository.get_user(user_id)) is None:
+            try:
+                user = await self._user_service.get_user_by_id(user_id)
+            except UserModel.DoesNotExist:
+                raise AuthUserUnknownHTTPException()
+
+            await self._warm_user_cache(user)
+
+        self._user_cache.set(user_id, user)
+        return user
+
+    async def _warm_user_cache(self, user: UserInternal) -> None:
+        # Best-effort: a failed cache write must never fail the request that triggered it
         try:
-            return await self._user_service.get_user_by_id(user_id)
-        except UserModel.DoesNotExist:
-            raise AuthUserUnknownHTTPException()
+            await self._user_cache_repository.set_user(user)
+        except Exception as error:
+            _logger.warning(f"Failed to warm shared user cache: {error}")
+
+    def _evict_session(self, session_uuid: UUIDString) -> None:
+        self._auth_info_cache.pop_group(session_uuid)
+
+    async def _evict_user(self, user_id: int | None) -> None:
+        if user_id is None:
+            self._user_cache.clear()
+            self._auth_info_cache.clear()
+            return
+
+        self._user_cache.pop(user_id)
+
+        # Auth info embeds the user as well
+        for session in await self._session_service.get_user_sessions(user_id):
+            self._evict_session(session.session_uuid)
 
     async def _revoke_session(self, user_id: int, session_uuid: UUIDString) -> None:
         await self._session_service.revoke_session(user_id, session_uuid)
+        self._evict_session(session_uuid)  # Other workers are notified through the revocation channel
 
-    async def _handle_suspicious_activity(self, user: UserInternal, session: AuthSessionInternal) -> None:
+    async def _handle_suspicious_activity(self, session: AuthSessionInternal) -> None:
         await self._log_security_event()
-        await self._revoke_session(user.id, session.session_uuid)
+        await self._revoke_session(session.user_id, session.session_uuid)
 
     async def suspicious_activity_check(self, session: AuthSessionInternal, current_client_ip: str, current_client_user_agent: str) -> bool:
         return session.ip_address == current_client_ip and session.user_agent == current_client_user_agent
@@ -63,15 +120,23 @@ class AuthServiceST(metaclass=SingletonMeta):
             user_agent: str,
             session_name: str
     ) -> tuple[AuthInfo, AuthTokenPair]:
-        access_token_uuid = str(uuid4())
-        refresh_token_uuid = str(uuid4())
+        session_uuid = generate_uuid_string()
+        access_token_uuid = generate_uuid_string()
+        refresh_token_uuid = generate_uuid_string()
 
-        session = await self._session_service.create_session(
-            user.id, ip_address, user_agent, session_name, access_token_uuid, refresh_token_uuid
-        )
+        async with asyncio.TaskGroup() as task_group:
+            save_session_task = task_group.create_task(self._session_service.create_session(
+                user.id, ip_address, user_agent, session_name, access_token_uuid, refresh_token_uuid, session_uuid
+            ))
+            # Warms the shared user cache for the first authenticated request, hidden behind the session write
+            task_group.create_task(self._warm_user_cache(user))
+            await asyncio.sleep(0)  # Let both writes reach Redis, then sign tokens while waiting for the replies
 
-        access_token = create_access_token(user.id, session.session_uuid, token_uuid=access_token_uuid)
-        refresh_token = create_refresh_token(user.id, session.session_uuid, token_uuid=refresh_token_uuid)
+            access_token = create_access_token(user.id, session_uuid, token_uuid=access_token_uuid)
+            refresh_token = create_refresh_token(user.id, session_uuid, token_uuid=refresh_token_uuid)
+
+        session = save_session_task.result()
+        self._user_cache.set(user.id, user)
 
         token_pair = AuthTokenPair(
             access_token=access_token,
@@ -85,29 +150,60 @@ class AuthServiceST(metaclass=SingletonMeta):
 
         return auth_info, token_pair
 
+    async def _authenticate(self, access_token: str, cache_key: bytes) -> AuthInfo:
+        payload = decode_access_token_with_http_exceptions(access_token)
+
+        # The signed payload already names the user, so the user lookup overlaps the session check
+        # instead of waiting for it (both are Redis round-trips when the local caches are cold)
+        session, user = await asyncio.gather(
+            self._session_service.validate_access_token(access_token),
+            self._get_user_by_id(payload.user_id)
+        )
+        auth_info = AuthInfo(user=user, session=session)
+
+        # Cached auth info must never outlive the token itself
+        ttl = min(project_settings.AUTH_INFO_CACHE_TTL, payload.exp.timestamp() - time.time())
+        self._auth_info_cache.set(cache_key, auth_info, ttl=ttl, group=session.session_uuid)
+
+        return auth_info
+
     async def authenticate(self, access_token: str) -> AuthInfo:
-        session = await self._session_service.validate_access_token(access_token)
-        user = await self._get_user_by_id(session.user_id)
-        return AuthInfo(user=user, session=session)
+        cache_key = get_token_cache_key(access_token)
+
+        if (auth_info := self._auth_info_cache.get(cache_key)) is not None:
+            return auth_info
+
+        # Concurrent first requests with the same token share a single verification
+        if (task := self._pending_authentications.get(cache_key)) is None:
+            task = self._pending_authentications[cache_key] = create_detached_task(self._authenticate(access_token, cache_key))
+            task.add_done_callback(lambda _: self._pending_authentications.pop(cache_key, None))
+
+        return await asyncio.shield(task)
 
     async def refresh(self, refresh_token: str, current_client_ip: str, current_client_user_agent: str) -> AuthTokenPair:
         session = await self._session_service.validate_refresh_token(refresh_token)
-        user = await self._get_user_by_id(session.user_id)
 
+        # Checked before any user lookup, so rejected refresh attempts never reach the database
         if not await self.suspicious_activity_check(session, current_client_ip, current_client_user_agent):
-            await self._handle_suspicious_activity(user, session)
+            await self._handle_suspicious_activity(session)
             raise SuspiciousActivityHTTPException(status_code=HTTPStatus.FORBIDDEN)
 
-        new_access_token_uuid = str(uuid4())
-        new_refresh_token_uuid = str(uuid4())
+        user = await self._get_user_by_id(session.user_id)
+
+        new_access_token_uuid = generate_uuid_string()
+        new_refresh_token_uuid = generate_uuid_string()
 
         new_access_token = create_access_token(user.id, session.session_uuid, token_uuid=new_access_token_uuid)
         new_refresh_token = create_refresh_token(user.id, session.session_uuid, token_uuid=new_refresh_token_uuid)
 
-        session.access_token_uuid = new_access_token_uuid
-        session.refresh_token_uuid = new_refresh_token_uuid
+        session = session.model_copy(update={
+            "access_token_uuid": new_access_token_uuid,
+            "refresh_token_uuid": new_refresh_token_uuid,
+            "expires_at": calculate_refresh_expire_at()
+        })
 
         await self._session_service.update_session(session)
+        self._evict_session(session.session_uuid)  # The old access token must stop working right away
 
         return AuthTokenPair(
             access_token=new_access_token,
@@ -139,4 +235,32 @@ class AuthServiceST(metaclass=SingletonMeta):
         return await self._create_session(user, ip_address, user_agent, session_name)
 
     async def revoke_session(self, user_id: int, session_uuid: UUIDString) -> None:
-        await self._session_service.revoke_session(user_id, session_uuid)
+        await self._revoke_session(user_id, session_uuid)
+
+    async def listen_revocations(self) -> None:
+        # Evicts sessions revoked by any worker, so cached auth info never outlives revocation by more than one RTT
+        while True:
+            try:
+                # Revocations published while disconnected are lost, so start over with an empty cache
+                self._auth_info_cache.clear()
+
+                async for session_uuid in self._session_service.listen_revoked_sessions():
+                    self._evict_session(session_uuid)
+            except Exception as error:
+                _logger.error(f"Auth revocation listener failed: {error}")
+
+            await asyncio.sleep(project_settings.AUTH_REVOCATION_LISTENER_RETRY_DELAY)
+
+    async def listen_user_changes(self) -> None:
+        # Drops cached users changed by any worker, so they never outlive the database record by more than one RTT
+        while True:
+            try:
+                # Changes published while disconnected are lost, so start over with empty caches
+                await self._evict_user(None)
+
+                async for user_id in self._user_cache_repository.listen_changed_users():
+                    await self._evict_user(user_id)
+            except Exception as error:
+                _logger.error(f"Auth user change listener failed: {error}")
+
+            await asyncio.sleep(project_settings.AUTH_REVOCATION_LISTENER_RETRY_DELAY)
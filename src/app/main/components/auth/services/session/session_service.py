@@ -1,5 +1,6 @@
 from abc import ABCMeta
 from http import HTTPStatus
+from typing import AsyncGenerator
 
 from src.app.main.components.auth.entities.auth_session import AuthSessionInternal
 from src.app.main.components.auth.exceptions import InvalidSessionHTTPException, TokenExpiredHTTPException
@@ -56,10 +57,11 @@ class SessionServiceST(metaclass=ABCMeta):
             user_agent: str,
             session_name: str,
             access_token_uuid: UUIDString,
-            refresh_token_uuid: UUIDString
+            refresh_token_uuid: UUIDString,
+            session_uuid: UUIDString | None = None
     ) -> AuthSessionInternal:
         return await self._session_repository.create_session(
-            user_id, ip_address, user_agent, session_name, access_token_uuid, refresh_token_uuid
+            user_id, ip_address, user_agent, session_name, access_token_uuid, refresh_token_uuid, session_uuid
         )
 
     async def get_user_sessions(self, user_id: int) -> tuple[AuthSessionInternal, ...]:
@@ -70,3 +72,6 @@ class SessionServiceST(metaclass=ABCMeta):
 
     async def revoke_other_sessions(self, user_id: int, keep_session_uuid: UUIDString) -> None:
         return await self._session_repository.revoke_other_sessions(user_id, keep_session_uuid)
+
+    def listen_revoked_sessions(self) -> AsyncGenerator[UUIDString, None]:
+        return self._session_repository.listen_revoked_sessions()
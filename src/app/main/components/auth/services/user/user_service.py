@@ -1,19 +1,54 @@
-import hashlib
+from typing import Any
 
+from src.app.bases.repositories import RepositoryEventType
 from src.app.main.components.auth.entities.user import UserModel, UserInternal
+from src.app.main.components.auth.internal_utils.hashers import hash_password, verify_password, needs_rehash
+from src.app.main.components.auth.repositories.user.redis_user_cache_repository import RedisUserCacheRepositoryST
 from src.app.main.components.auth.repositories.user.user_repository import UserRepositoryST
+from src.core.utils.async_tools import run_in_threadpool, gather_all
 from src.core.utils.singleton import SingletonMeta
 
 
 class UserServiceST(metaclass=SingletonMeta):
     def __init__(self) -> None:
         self._user_repository = UserRepositoryST()
+        self._user_cache_repository = RedisUserCacheRepositoryST()
+
+        # Every write to users goes through the repository, so cached copies are invalidated on any update path
+        self._user_repository.listen(RepositoryEventType.POST_UPDATE)(self._on_users_changed)
+        self._user_repository.listen(RepositoryEventType.POST_DELETE)(self._on_users_changed)
+        self._user_repository.listen(RepositoryEventType.POST_BULK_UPDATE)(self._on_users_bulk_changed)
+
+    async def _on_users_changed(self, **event: Any) -> None:
+        if (model_obj := event.get("model_obj")) is not None:
+            user_ids = [model_obj.id]
+        elif (pk := event.get("pk")) is not None:
+            user_ids = [pk]
+        else:
+            result = event.get("result")
+            user_models = result if isinstance(result, tuple) else (result,) if result is not None else ()
+            user_ids = [user_model.id for user_model in user_models]
+
+        for user_id in user_ids:
+            await self._user_cache_repository.invalidate_user(user_id)
+
+    async def _on_users_bulk_changed(self, **_: Any) -> None:
+        # Bulk updates do not report which rows they touched
+        await self._user_cache_repository.invalidate_all_users()
 
     def hash_password(self, password: str, encoding: str = "utf-8") -> str:
-        return hashlib.sha256(password.encode(encoding=encoding)).hexdigest()
+        return hash_password(password, encoding)
+
+    async def _hash_password_async(self, password: str) -> str:
+        # KDF is CPU and memory heavy, so it must not block the event loop
+        return await run_in_threadpool(self.hash_password, password)
+
+    async def hash_passwords(self, passwords: list[str]) -> list[str]:
+        # hashlib.scrypt releases the GIL, so independent hashes run in parallel on the threadpool
+        return list(await gather_all(self._hash_password_async(password) for password in passwords))
 
     async def create_user(self, username: str, password: str, **fields) -> UserInternal:
-        user_model = UserModel(username=username, password=self.hash_password(password), **fields)
+        user_model = UserModel(username=username, password=await self._hash_password_async(password), **fields)
         await self._user_repository.create(user_model)
         return user_model.to_schema(UserInternal)
 
@@ -26,6 +61,14 @@ class UserServiceST(metaclass=SingletonMeta):
         return user_model.to_schema(UserInternal)
 
     async def get_by_auth_credentials(self, username: str, password_raw: str, **fields) -> UserInternal:
-        password_hash = self.hash_password(password_raw)
-        user_model = await self._user_repository.get_one_by_strict(username=username, password=password_hash, **fields)
-        return user_model.to_schema(UserInternal)
+        user_model = await self._user_repository.get_one_by_strict(username=username, **fields)
+
+        if not await run_in_threadpool(verify_password, password_raw, user_model.password_hash):
+            raise UserModel.DoesNotExist(f"Not found {UserModel.__name__} with given credentials")
+
+        user = user_model.to_schema(UserInternal)
+
+        if needs_rehash(user_model.password_hash):  # Transparently upgrade legacy hashes
+            await self._user_repository.update_by_pk(user.id, password=await self._hash_password_async(password_raw))
+
+        return user
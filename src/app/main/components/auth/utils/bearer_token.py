@@ -0,0 +1,28 @@
+from http import HTTPStatus
+from typing import Optional
+
+from src.app.main.components.auth.exceptions import (
+    AuthorizationNotSpecifiedHTTPException,
+    AuthorizationInvalidHTTPException,
+    AuthorizationTypeUnknownHTTPException,
+    TokenNotSpecifiedHTTPException
+)
+
+# Common spellings matched without allocating a lowercased copy; other casings fall back to `.lower()`
+_BEARER_TYPES_FAST: frozenset[str] = frozenset({"Bearer", "bearer", "BEARER"})
+
+
+async def extract_bearer_token(header: Optional[str]) -> str:
+    if not header:
+        raise AuthorizationNotSpecifiedHTTPException(status_code=HTTPStatus.UNAUTHORIZED)
+
+    # Single pass: exactly one space must separate the type and the token
+    type_, separator, access_token = header.partition(" ")
+    if not separator or " " in access_token:
+        raise AuthorizationInvalidHTTPException(status_code=HTTPStatus.UNAUTHORIZED)
+    elif type_ not in _BEARER_TYPES_FAST and type_.lower() != "bearer":
+        raise AuthorizationTypeUnknownHTTPException(status_code=HTTPStatus.UNAUTHORIZED)
+    elif not access_token:
+        raise TokenNotSpecifiedHTTPException(status_code=HTTPStatus.UNAUTHORIZED)
+
+    return access_token
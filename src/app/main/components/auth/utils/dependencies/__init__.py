@@ -0,0 +1,5 @@
+from .http_auth import HTTPJWTBearerAuthDependency
+from .ws_auth import WSJWTBearerAuthDependency
+
+# Shared by all routes, so FastAPI resolves one dependency per request even when it is declared in several places
+jwt_auth = HTTPJWTBearerAuthDependency()
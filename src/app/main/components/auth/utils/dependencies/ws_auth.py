@@ -5,19 +5,19 @@ from starlette.websockets import WebSocket
 from src.app.main.components.auth.entities.auth_info import AuthInfo
 from src.app.main.components.auth.exceptions import AuthHTTPException
 from src.app.main.components.auth.services.auth_service import AuthServiceST
-from src.app.main.components.auth.utils.bearer_auth_mixin import BearerAuthMixin
+from src.app.main.components.auth.utils.bearer_token import extract_bearer_token
 from src.core.state import project_settings
 
 _auth_service = AuthServiceST()
 _logger = logging.getLogger(__name__)
 
 
-class WSJWTBearerAuthDependency(BearerAuthMixin):
+class WSJWTBearerAuthDependency:
     async def __call__(self, websocket: WebSocket) -> AuthInfo:
         authorization = websocket.headers.get("Authorization")
 
         try:
-            access_token = await self.extract_token(authorization)
+            access_token = await extract_bearer_token(authorization)
             return await _auth_service.authenticate(access_token)
         except AuthHTTPException as error:
             await websocket.close(
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey, Index
 
 from src.app.bases.db import BaseModel
 from src.app.main.components.auth.entities.user import UserModel
@@ -9,12 +9,16 @@ from src.app.main.components.auth.entities.user import UserModel
 class StorageChannelMessageModel(BaseModel):
     __tablename__ = 'storage_channel_messages'
     __pk_field__ = "id"
+    __table_args__ = (
+        # Matches channel history reads: user_id = ? AND channel_name = ? AND id > ? ORDER BY id LIMIT ?
+        Index("ix_storage_channel_messages_user_channel_id", "user_id", "channel_name", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey(UserModel.id), nullable=False)
     intent = Column(String(50), nullable=False)
     sender_name = Column(String(50), index=True, nullable=False)
     target_name = Column(String(50), index=True, nullable=False)
-    channel_name = Column(String(50), index=True, nullable=False)
+    channel_name = Column(String(50), nullable=False)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     data = Column(JSON, nullable=False)
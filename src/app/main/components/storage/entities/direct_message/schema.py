@@ -1,15 +1,15 @@
 from typing import Literal
-from uuid import uuid4
 
 from pydantic import Field, field_validator
 
 from src.app.main.components.storage.entities.direct_message.intent import StorageDirectMessageIntent
 from src.app.main.components.storage.entities.storage_message import StorageMessage
+from src.core.utils.identifiers import generate_uuid_string
 from src.core.utils.types import UUIDString
 
 
 class StorageDirectMessage(StorageMessage):
-    uuid: UUIDString = Field(default_factory=lambda x: str(uuid4()))
+    uuid: UUIDString = Field(default_factory=generate_uuid_string)
     intent: StorageDirectMessageIntent
 
     # noinspection PyNestedDecorators
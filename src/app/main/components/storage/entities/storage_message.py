@@ -12,3 +12,8 @@ class StorageMessage(BaseSchema):
     target_name: str = Field(..., max_length=50)  # TODO: Validate it (must not start/end with __)
     created_at: datetime = Field(default_factory=datetime.now)
     data: JsonDict
+
+    def to_json_bytes(self) -> bytes:
+        # Serialized straight to bytes, skipping `model_dump_json`'s str round-trip. Unlike orjson, pydantic-core
+        # also encodes integers wider than 64 bits, which `data` accepts
+        return self.__pydantic_serializer__.to_json(self)
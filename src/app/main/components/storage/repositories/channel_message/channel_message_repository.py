@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import AsyncIterator, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -44,3 +44,17 @@ class StorageChannelMessageRepositoryST(ObservableRepository[StorageChannelMessa
         async with self.__db_manager__.session() as session:
             messages = await self._fetch_messages(session, user_id, channel_name, offset_id, limit)
             return tuple(map(lambda x: x.to_schema(StorageChannelMessage), messages))  # type: ignore
+
+    async def iter_messages(
+            self,
+            user_id: int,
+            channel_name: str,
+            offset_id: int,
+            limit: int
+    ) -> AsyncIterator[StorageChannelMessage]:
+        # Rows are fetched within the session (bounded by `limit`), schemas are built as the caller consumes them
+        async with self.__db_manager__.session() as session:
+            messages = await self._fetch_messages(session, user_id, channel_name, offset_id, limit)
+
+        for message in messages:
+            yield message.to_schema(StorageChannelMessage)  # type: ignore
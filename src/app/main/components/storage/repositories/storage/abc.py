@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Unpack
+from typing import AsyncIterator, Unpack
 
 from src.app.main.components.storage.entities import (
     StorageDirectResponse,
@@ -26,10 +26,18 @@ class AbstractStorageRepository(ABC):
     async def write_to_channel(self, **message_data: Unpack[StorageChannelMessageCreateTD]) -> StorageChannelMessage:
         ...
 
+    @abstractmethod
+    def iter_channel(self, user_id: int, channel_name: str, offset_id: int, limit: int, *, timeout: int) -> AsyncIterator[StorageChannelMessage]:
+        ...
+
     @abstractmethod
     async def listen_channel(self, user_id: int, channel_name: str, offset_id: int, limit: int, *, timeout: int) -> tuple[StorageChannelMessage, ...]:
         ...
 
+    @abstractmethod
+    def iter_direct(self, user_id: int, device_name: str, limit: int, *, timeout: int) -> AsyncIterator[StorageDirectMessage]:
+        ...
+
     @abstractmethod
     async def listen_direct(self, user_id: int, device_name: str, limit: int, *, timeout: int) -> tuple[StorageDirectMessage, ...]:
         ...
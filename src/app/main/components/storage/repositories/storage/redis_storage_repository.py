@@ -1,8 +1,9 @@
 import asyncio
 import logging
-from typing import Unpack
+import zlib
+from typing import Any, AsyncIterator, Unpack
 
-from redis import ResponseError
+from redis.asyncio.client import PubSub
 
 from src.app.main.components.storage.entities import (
     StorageDirectResponse,
@@ -19,50 +20,114 @@ from src.app.main.redis import RedisClientMixin
 from src.core.exceptions import ConcurrencyError
 from src.core.exceptions import IllegalArgumentError
 from src.core.state import project_settings
-from src.core.utils.async_tools import NamedAsyncLock
+from src.core.utils.async_tools import NamedAsyncLock, TickBatcher, create_detached_task
 from src.core.utils.types import UUIDString
 
 _logger = logging.getLogger(__name__)
 
 
 class RedisStorageRepository(RedisClientMixin, AbstractStorageRepository):
+    # Pops up to ARGV[1] messages from the head of the list atomically, leaving the rest in place
+    DRAIN_DIRECT_SCRIPT: str = """
+        local messages = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+        if #messages > 0 then
+            redis.call('LTRIM', KEYS[1], #messages, -1)
+        end
+        return messages
+    """
+
+    # Every channel write is announced on its notify channel, so waiters share one subscription per worker
+    CHANNEL_NOTIFY_PATTERN: str = "storage:*:channel:*:__notify__"
+
     def __init__(self) -> None:
-        super().__init__(db=project_settings.STORAGE_REDIS_DB_ID)
+        # Direct messages may be stored compressed, so they are read as raw bytes (see `_encode_direct`)
+        super().__init__(
+            db=project_settings.STORAGE_REDIS_DB_ID,
+            blocking_pool_size=project_settings.STORAGE_REDIS_BLOCKING_POOL_SIZE,
+            blocking_decode_responses=False
+        )
 
         self._scm_service = StorageChannelMessageServiceST()
         self._direct_listen_lock = NamedAsyncLock()
 
+        # Channel writes issued within the same event loop tick share one INSERT and one Redis pipeline
+        self._channel_insert_batcher: TickBatcher[StorageChannelMessageModel, StorageChannelMessage] = TickBatcher(
+            self._insert_channel_messages,
+            max_size=project_settings.STORAGE_WRITE_BATCH_MAX
+        )
+        self._channel_stream_batcher: TickBatcher[StorageChannelMessage, None] = TickBatcher(self._add_to_channel_streams)
+
+        # Direct messages and responses sent within the same tick share one Redis pipeline
+        self._direct_push_batcher: TickBatcher[tuple[str, bytes], None] = TickBatcher(
+            self._push_direct_messages,
+            max_size=project_settings.STORAGE_WRITE_BATCH_MAX
+        )
+
+        # Futures of channel waiters keyed by notify channel, resolved by a single pattern subscription
+        self._channel_waiters: dict[str, set[asyncio.Future[int]]] = {}
+        self._channel_notifications_task: asyncio.Task[None] | None = None
+        self._channel_notifications_lock = asyncio.Lock()
+
     def _get_user_storage_key(self, user_id: int) -> str:
         return f"storage:{user_id}"
 
+    # Leaf keys are built with a single f-string each (no nested helper calls) as they are used on every operation
+
     def _get_channel_key(self, user_id: int, channel_name: str) -> str:
-        return self._get_user_storage_key(user_id) + f":channel:{channel_name}"
+        return f"storage:{user_id}:channel:{channel_name}"
 
     def _get_channel_meta_key(self, user_id: int, channel_name: str) -> str:
-        return self._get_channel_key(user_id, channel_name) + ":__meta__"
+        return f"storage:{user_id}:channel:{channel_name}:__meta__"
 
     def _get_channel_stream_key(self, user_id: int, channel_name: str) -> str:
-        return self._get_channel_key(user_id, channel_name) + ":__stream__"
+        return f"storage:{user_id}:channel:{channel_name}:__stream__"
+
+    def _get_channel_notify_key(self, user_id: int, channel_name: str) -> str:
+        return f"storage:{user_id}:channel:{channel_name}:__notify__"
 
     def _get_direct_key(self, user_id: int, target_name: str) -> str:
-        return self._get_user_storage_key(user_id) + f":direct:{target_name}"
+        return f"storage:{user_id}:direct:{target_name}"
 
     def _get_response_direct_key(self, user_id: int, sender_name: str, response_to_message_uuid: str) -> str:
-        return self._get_direct_key(user_id, sender_name) + f":response:{response_to_message_uuid}"
+        return f"storage:{user_id}:direct:{sender_name}:response:{response_to_message_uuid}"
+
+    @staticmethod
+    def _encode_direct(message: StorageDirectMessage) -> bytes:
+        encoded = message.to_json_bytes()
+
+        # Large user payloads are compressed. JSON objects start with "{" and zlib streams with "x", so no marker is needed
+        if len(encoded) >= project_settings.STORAGE_DIRECT_COMPRESSION_MIN_SIZE:
+            return zlib.compress(encoded, project_settings.STORAGE_DIRECT_COMPRESSION_LEVEL)
+
+        return encoded
+
+    @staticmethod
+    def _decode_direct(encoded: bytes) -> bytes:
+        return encoded if encoded[:1] == b"{" else zlib.decompress(encoded)
 
     async def _wait_for_direct_response(self, request: StorageDirectRequest, *, timeout: int) -> StorageDirectResponse | None:
-        redis = await self.get_redis()
+        redis = await self.get_blocking_redis()
         key = self._get_response_direct_key(request.user_id, request.target_name, request.uuid)
 
         if (result := await redis.blpop([key], timeout=timeout)) is None:  # type: ignore
             return None
 
-        return StorageDirectResponse.model_validate_json(result[1])
+        return StorageDirectResponse.model_validate_json(self._decode_direct(result[1]))
 
-    async def _send_direct(self, message: StorageDirectMessage, *, key: str | None = None, ttl: int | None = None) -> None:
+    async def _push_direct_messages(self, messages: list[tuple[str, bytes]]) -> list[None | Exception]:
         redis = await self.get_redis()
+
+        async with redis.pipeline(transaction=False) as pipe:
+            for key, message in messages:
+                pipe.rpush(key, message)
+
+            results = await pipe.execute(raise_on_error=False)
+
+        return [result if isinstance(result, Exception) else None for result in results]
+
+    async def _send_direct(self, message: StorageDirectMessage, *, key: str | None = None, ttl: int | None = None) -> None:
         key = key if key is not None else self._get_direct_key(message.user_id, message.target_name)
-        await redis.rpush(key, message.model_dump_json())  # type: ignore
+        await self._direct_push_batcher.submit((key, self._encode_direct(message)))
 
         # if ttl is not None:
         #     await redis.expire(key, time=ttl)  # FIXME: This will delete whole list, not just this message
@@ -83,8 +148,8 @@ class RedisStorageRepository(RedisClientMixin, AbstractStorageRepository):
         key = self._get_response_direct_key(response.user_id, response.sender_name, response_to_message_uuid)
         await self._send_direct(response, key=key, ttl=ttl)  # Use TTL with response is safe because each response has its own key
 
-    async def _listen_direct(self, user_id: int, device_name: str, limit: int, timeout: int) -> tuple[StorageDirectMessage, ...]:
-        redis = await self.get_redis()
+    async def _pop_direct(self, user_id: int, device_name: str, limit: int, timeout: int) -> list[bytes]:
+        redis = await self.get_blocking_redis()
         key = self._get_direct_key(user_id, device_name)
 
         if self._direct_listen_lock.is_locked(device_name):
@@ -92,106 +157,210 @@ class RedisStorageRepository(RedisClientMixin, AbstractStorageRepository):
 
         async with self._direct_listen_lock(device_name):
             try:
+                if project_settings.STORAGE_REDIS_USE_BLMPOP:
+                    # Blocks until messages arrive and pops up to `limit` of them in a single command
+                    if (result := await redis.blmpop(timeout, 1, key, direction="LEFT", count=limit)) is None:  # type: ignore
+                        return []
+
+                    return result[1]
+
                 if (first := await redis.blpop([key], timeout=timeout)) is None:  # type: ignore
-                    return tuple()
+                    return []
             except asyncio.CancelledError:
-                return tuple()
+                return []
+
+            messages = [first[1]]
+
+            if limit > 1:
+                drain_script = await self.get_script(self.DRAIN_DIRECT_SCRIPT)
+                messages += await drain_script(keys=[key], args=[limit - 1], client=redis)  # Raw bytes, like the pop
+
+            return messages
+
+    async def _iter_direct(self, user_id: int, device_name: str, limit: int, timeout: int) -> AsyncIterator[StorageDirectMessage]:
+        # Messages are popped at once (that is atomic anyway), but decoded only as the caller consumes them
+        for message in await self._pop_direct(user_id, device_name, limit, timeout):
+            yield StorageDirectMessage.model_validate_json(self._decode_direct(message))
+
+    async def _insert_channel_messages(self, models: list[StorageChannelMessageModel]) -> list[StorageChannelMessage | Exception]:
+        # Ids are assigned by a single multi-row INSERT ... RETURNING ("insertmanyvalues")
+        try:
+            await self._scm_service.bulk_create(models)
+        except Exception as error:
+            if len(models) == 1:
+                raise
+
+            _logger.debug(f"Batched insert of {len(models)} channel messages failed ({error}), retrying them one by one")
+            return [await self._insert_channel_message(model) for model in models]
+
+        return [model.to_schema(StorageChannelMessage) for model in models]
+
+    async def _insert_channel_message(self, model: StorageChannelMessageModel) -> StorageChannelMessage | Exception:
+        # One bad row must not fail the whole batch, so each submitter gets its own result
+        try:
+            await self._scm_service.create(model)
+        except Exception as error:
+            return error
+
+        return model.to_schema(StorageChannelMessage)
+
+    async def _add_to_channel_streams(self, messages: list[StorageChannelMessage]) -> list[None | Exception]:
+        redis = await self.get_redis()
+
+        results: list[None | Exception] = [None] * len(messages)
+        encoded: dict[int, bytes] = {}
+
+        # A message that fails to encode fails only its own submitter, the rest of the batch is still added
+        for index, message in enumerate(messages):
+            try:
+                encoded[index] = message.to_json_bytes()
+            except Exception as error:
+                results[index] = error
+
+        # Ascending ids, so entries of one batch never violate stream id ordering among themselves
+        order = sorted(encoded, key=lambda index: messages[index].id)
 
-            messages = [first[1]] + await redis.lrange(key, 0, limit - 2)  # type: ignore
+        if len(order) == 0:
+            return results
 
-            await redis.ltrim(key, limit - 2, -1)
-            return tuple(map(StorageDirectMessage.model_validate_json, messages))
+        async with redis.pipeline(transaction=False) as pipe:
+            for index in order:
+                message = messages[index]
+
+                pipe.xadd(  # FIXME: redis.exceptions.ResponseError: The ID specified in XADD is equal or smaller than the target stream top item
+                    name=self._get_channel_stream_key(message.user_id, message.channel_name),
+                    fields={"data": encoded[index]},
+                    id=f"{message.id}-0",
+                    maxlen=project_settings.STORAGE_CHANNEL_CACHE_SIZE,
+                    approximate=True
+                )
+                pipe.publish(self._get_channel_notify_key(message.user_id, message.channel_name), message.id)
+
+            pipeline_results = (await pipe.execute(raise_on_error=False))[::2]  # XADD results only
+
+        for index, result in zip(order, pipeline_results):
+            results[index] = result if isinstance(result, Exception) else None
+
+        return results
 
     async def _write_to_channel(self, **message_data: Unpack[StorageChannelMessageCreateTD]) -> StorageChannelMessage:
         # Save to db
-        model = StorageChannelMessageModel(**message_data)
-        await self._scm_service.create(model)
-        message = model.to_schema(StorageChannelMessage)
+        message = await self._channel_insert_batcher.submit(StorageChannelMessageModel(**message_data))
 
         # Add to redis stream
-        redis = await self.get_redis()
-        key = self._get_channel_stream_key(message.user_id, message.channel_name)
-
-        await redis.xadd(  # FIXME: redis.exceptions.ResponseError: The ID specified in XADD is equal or smaller than the target stream top item
-            name=key,
-            fields={"data": message.model_dump_json()},  # TODO: Should I create new dict here?
-            id=f"{message.id}-0",
-            maxlen=project_settings.STORAGE_CHANNEL_CACHE_SIZE,
-            approximate=True
-        )
-
+        await self._channel_stream_batcher.submit(message)
         return message
 
-    async def _wait_for_message_in_redis(self, user_id: int, channel_name: str, timeout: int) -> tuple[StorageChannelMessage, ...]:
+    async def _dispatch_channel_notifications(self, pubsub: PubSub) -> None:
+        try:
+            async for notification in pubsub.listen():
+                for future in self._channel_waiters.get(notification["channel"], ()):
+                    if not future.done():
+                        future.set_result(int(notification["data"]))
+        except Exception as error:
+            _logger.error(f"Channel notifications listener stopped: {error}")
+        finally:
+            try:
+                await pubsub.aclose()
+            finally:
+                # Nothing would ever notify current waiters, so they re-read the stream instead. No `await` follows,
+                # so this task is done before any later waiter checks it (and respawns the listener)
+                for waiters in self._channel_waiters.values():
+                    for future in waiters:
+                        if not future.done():
+                            future.set_result(0)
+
+    async def _ensure_channel_notifications_listener(self) -> None:
+        async with self._channel_notifications_lock:
+            if self._channel_notifications_task is not None and not self._channel_notifications_task.done():
+                return
+
+            # Subscribed before the task starts, so no notification is missed once this returns
+            redis = await self.get_redis()
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            await pubsub.psubscribe(self.CHANNEL_NOTIFY_PATTERN)
+
+            self._channel_notifications_task = create_detached_task(self._dispatch_channel_notifications(pubsub))
+
+    async def _wait_for_message_in_redis(
+            self,
+            user_id: int,
+            channel_name: str,
+            offset_id: int,
+            timeout: int,
+            limit: int
+    ) -> list[tuple[str, dict[str, Any]]]:
         _logger.debug(f"Waiting for messages in channel {user_id}:{channel_name}")
 
-        redis = await self.get_redis()
-        key = self._get_channel_stream_key(user_id, channel_name)
+        await self._ensure_channel_notifications_listener()
+
+        notify_key = self._get_channel_notify_key(user_id, channel_name)
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self._channel_waiters.setdefault(notify_key, set()).add(future)
 
-        # Using '$' means we only want messages that arrive after this call
-        if not (response := await redis.xread({key: '$'}, block=timeout * 1000)):
-            return tuple()
+        # Only messages that arrive after this call are awaited, without parking a connection per waiter
+        try:
+            # Zero timeout means "wait forever", as for the BLPOP-based direct listen
+            message_id = await asyncio.wait_for(future, timeout=timeout if timeout > 0 else None)
+        except asyncio.TimeoutError:
+            return []
+        finally:
+            waiters = self._channel_waiters[notify_key]
+            waiters.discard(future)
 
-        messages: list[StorageChannelMessage] = []
+            if len(waiters) == 0:
+                del self._channel_waiters[notify_key]
 
-        for stream_name, stream_messages in response:
-            for message_id, message_data in stream_messages:
-                messages.append(StorageChannelMessage.model_validate_json(message_data["data"]))
+        redis = await self.get_redis()
+        key = self._get_channel_stream_key(user_id, channel_name)
 
-        return tuple(messages)
+        # Waiters released without a notification (message id 0) read everything after the requested offset
+        return await redis.xrange(key, min=f"{max(message_id, offset_id + 1)}-0", max="+", count=limit)
 
-    async def _fetch_messages_from_redis(self, user_id: int, channel_name: str, offset_id: int, limit: int) -> tuple[StorageChannelMessage, ...]:
+    async def _fetch_messages_from_redis(self, user_id: int, channel_name: str, offset_id: int, limit: int) -> tuple[int, list[tuple[str, dict[str, Any]]]]:
         _logger.debug(f"Fetching messages from redis stream for channel {user_id}:{channel_name}, offset_id={offset_id}")
 
         redis = await self.get_redis()
         key = self._get_channel_stream_key(user_id, channel_name)
 
-        messages = await redis.xrange(key, min=f"{offset_id + 1}-0", max="+", count=limit)  # offset_id + 1 for not to return message that user already had seen
-        return tuple(StorageChannelMessage.model_validate_json(message[1]["data"]) for message in messages)
+        # Stream bottom entry and requested entries in one round-trip
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.xrange(key, min="-", max="+", count=1)
+            pipe.xrange(key, min=f"{offset_id + 1}-0", max="+", count=limit)  # offset_id + 1 for not to return message that user already had seen
+            bottom_entries, entries = await pipe.execute()
 
-    async def _fetch_messages_from_db(self, user_id: int, channel_name: str, offset_id: int, limit: int) -> tuple[StorageChannelMessage, ...]:
-        _logger.debug(f"Fetching messages from db for channel {user_id}:{channel_name}, offset_id={offset_id}")
+        # Bottom message id is -1 if the stream is empty (or doesn't exist)
+        bottom_message_id = int(bottom_entries[0][0].split("-")[0]) if bottom_entries else -1
+        return bottom_message_id, entries
 
-        return await self._scm_service.get_messages(user_id, channel_name, offset_id, limit)
+    async def _iter_messages_from_db(self, user_id: int, channel_name: str, offset_id: int, limit: int) -> AsyncIterator[StorageChannelMessage]:
+        _logger.debug(f"Fetching messages from db for channel {user_id}:{channel_name}, offset_id={offset_id}")
 
-    async def _get_redis_stream_info(self, user_id: int, channel_name: str) -> tuple[int, int]:
-        redis = await self.get_redis()
-        key = self._get_channel_stream_key(user_id, channel_name)
+        async for message in self._scm_service.iter_messages(user_id, channel_name, offset_id, limit):
+            yield message
 
-        try:
-            info = await redis.xinfo_stream(key)
-            first_entry = info.get("first-entry")
-            last_entry = info.get("last-entry")
-        except ResponseError:
-            return -1, -1
-
-        # If the stream is empty, these entries will be empty or None.
-        if not first_entry or not last_entry:
-            return -1, -1
-
-        first_id = first_entry[0]
-        last_id = last_entry[0]
-        return int(first_id.split("-")[0]), int(last_id.split("-")[0])
-
-    async def _listen_channel(self, user_id: int, channel_name: str, offset_id: int, limit: int, timeout: int) -> tuple[StorageChannelMessage, ...]:
-        bottom_message_id, top_message_id = await self._get_redis_stream_info(user_id, channel_name)
+    async def _iter_channel(self, user_id: int, channel_name: str, offset_id: int, limit: int, timeout: int) -> AsyncIterator[StorageChannelMessage]:
+        bottom_message_id, entries = await self._fetch_messages_from_redis(user_id, channel_name, offset_id, limit)
         try:
             # Stream has no messages, wait for new ones
-            if top_message_id == -1:
-                return await self._wait_for_message_in_redis(user_id, channel_name, timeout)
+            if bottom_message_id == -1:
+                entries = await self._wait_for_message_in_redis(user_id, channel_name, offset_id, timeout, limit)
 
             # User requested messages that are no longer in the Redis stream (expired)
-            if offset_id < bottom_message_id:
-                return await self._fetch_messages_from_db(user_id, channel_name, offset_id, limit)
+            elif offset_id < bottom_message_id:
+                async for message in self._iter_messages_from_db(user_id, channel_name, offset_id, limit):
+                    yield message
+                return
 
             # User requested a message that does not exist yet (future message)
-            if top_message_id <= offset_id:
-                return await self._wait_for_message_in_redis(user_id, channel_name, timeout)
-
-            # Requested messages exist in Redis
-            return await self._fetch_messages_from_redis(user_id, channel_name, offset_id, limit)
+            elif len(entries) == 0:
+                entries = await self._wait_for_message_in_redis(user_id, channel_name, offset_id, timeout, limit)
         except asyncio.CancelledError:
-            return tuple()
+            return
+
+        # Stream entries are decoded only as the caller consumes them
+        for entry in entries:
+            yield StorageChannelMessage.model_validate_json(entry[1]["data"])
 
     async def send_direct(self, message: StorageDirectMessage, *, ttl: int | None = None) -> None:
         if message.intent in (StorageDirectMessageIntent.REQUEST, StorageDirectMessageIntent.RESPONSE):
@@ -204,11 +373,17 @@ class RedisStorageRepository(RedisClientMixin, AbstractStorageRepository):
     async def send_direct_response(self, response: StorageDirectResponse, response_to_message_uuid: UUIDString, *, ttl: int | None = None) -> None:
         await self._send_direct_response(response, response_to_message_uuid, ttl)
 
+    def iter_direct(self, user_id: int, device_name: str, limit: int, *, timeout: int) -> AsyncIterator[StorageDirectMessage]:
+        return self._iter_direct(user_id, device_name, limit, timeout)
+
     async def listen_direct(self, user_id: int, device_name: str, limit: int, *, timeout: int) -> tuple[StorageDirectMessage, ...]:
-        return await self._listen_direct(user_id, device_name, limit, timeout)
+        return tuple([message async for message in self._iter_direct(user_id, device_name, limit, timeout)])
 
     async def write_to_channel(self, **message_data: Unpack[StorageChannelMessageCreateTD]) -> StorageChannelMessage:
         return await self._write_to_channel(**message_data)
 
+    def iter_channel(self, user_id: int, channel_name: str, offset_id: int, limit: int, *, timeout: int) -> AsyncIterator[StorageChannelMessage]:
+        return self._iter_channel(user_id, channel_name, offset_id, limit, timeout)
+
     async def listen_channel(self, user_id: int, channel_name: str, offset_id: int, limit: int, *, timeout: int) -> tuple[StorageChannelMessage, ...]:
-        return await self._listen_channel(user_id, channel_name, offset_id, limit, timeout)
+        return tuple([message async for message in self._iter_channel(user_id, channel_name, offset_id, limit, timeout)])
@@ -1,3 +1,5 @@
+from typing import AsyncIterator
+
 from src.app.main.components.storage.entities import StorageChannelMessage, StorageChannelMessageModel
 from src.app.main.components.storage.repositories.channel_message.channel_message_repository import StorageChannelMessageRepositoryST
 from src.core.utils.singleton import SingletonMeta
@@ -10,5 +12,11 @@ class StorageChannelMessageServiceST(metaclass=SingletonMeta):
     async def get_messages(self, user_id: int, channel_name: str, offset_id: int, limit: int) -> tuple[StorageChannelMessage, ...]:
         return await self._channel_message_repository.get_messages(user_id, channel_name, offset_id, limit)
 
+    def iter_messages(self, user_id: int, channel_name: str, offset_id: int, limit: int) -> AsyncIterator[StorageChannelMessage]:
+        return self._channel_message_repository.iter_messages(user_id, channel_name, offset_id, limit)
+
     async def create(self, message: StorageChannelMessageModel) -> None:
         await self._channel_message_repository.create(message)
+
+    async def bulk_create(self, messages: list[StorageChannelMessageModel]) -> None:
+        await self._channel_message_repository.bulk_create(messages)
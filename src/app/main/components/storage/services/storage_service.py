@@ -1,4 +1,4 @@
-from typing import Unpack
+from typing import AsyncIterator, Unpack
 
 from src.app.main.components.storage.entities import StorageDirectRequest, StorageDirectResponse, StorageDirectMessage
 from src.app.main.components.storage.entities.channel_message.schemas import StorageChannelMessage
@@ -34,8 +34,14 @@ class StorageServiceST(metaclass=SingletonMeta):
     async def write_to_channel(self, **message_data: Unpack[StorageChannelMessageCreateTD]) -> StorageChannelMessage:
         return await self._storage_repository.write_to_channel(**message_data)
 
+    def iter_direct(self, user_id: int, device_name: str, limit: int, *, timeout: int) -> AsyncIterator[StorageDirectMessage]:
+        return self._storage_repository.iter_direct(user_id, device_name, limit, timeout=timeout)
+
     async def listen_direct(self, user_id: int, device_name: str, limit: int, *, timeout: int) -> tuple[StorageDirectMessage, ...]:
         return await self._storage_repository.listen_direct(user_id, device_name, limit, timeout=timeout)
 
+    def iter_channel(self, user_id: int, channel_name: str, offset_id: int, limit: int, *, timeout: int) -> AsyncIterator[StorageChannelMessage]:
+        return self._storage_repository.iter_channel(user_id, channel_name, offset_id, limit, timeout=timeout)
+
     async def listen_channel(self, user_id: int, channel_name: str, offset_id: int, limit: int, *, timeout: int) -> tuple[StorageChannelMessage, ...]:
         return await self._storage_repository.listen_channel(user_id, channel_name, offset_id, limit, timeout=timeout)
@@ -1 +1,2 @@
+from .context import ctx_session
 from .manager import AsyncDatabaseManagerST
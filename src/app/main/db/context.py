@@ -0,0 +1,6 @@
+from contextvars import ContextVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Session opened by the closest enclosing `AsyncDatabaseManagerST.session()` in the current context (if any)
+ctx_session: ContextVar[AsyncSession | None] = ContextVar("ctx_session", default=None)
@@ -1,3 +1,5 @@
+import re
+
 from sqlalchemy.exc import StatementError
 
 
@@ -9,3 +11,12 @@ error_mapping: dict[str, type[StatementError]] = {
     'duplicate entry': UniqueConstraintFailed,
     "UNIQUE constraint failed": UniqueConstraintFailed
 }
+
+# Built from `error_mapping` so it stays the single place to register new db errors
+_error_pattern: re.Pattern[str] = re.compile("|".join(map(re.escape, error_mapping)), re.IGNORECASE)
+_match_to_error: dict[str, type[StatementError]] = {key.lower(): value for key, value in error_mapping.items()}
+
+
+def classify_error(message: str) -> type[StatementError] | None:
+    match = _error_pattern.search(message)
+    return _match_to_error[match.group(0).lower()] if match is not None else None
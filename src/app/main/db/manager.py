@@ -1,12 +1,16 @@
+import asyncio
+from contextlib import asynccontextmanager
 from logging import getLogger
-from typing import Callable, AsyncContextManager, Generator, Any, Self
+from typing import AsyncContextManager, AsyncGenerator, Generator, Any, Self
 
-from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import AsyncAdaptedQueuePool, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, create_async_engine, async_sessionmaker
 
 from src.app.bases.db import AbstractAsyncDatabaseManager
-from src.app.bases.db import async_session_error_convert_wrapper
-from src.app.main.db.exceptions import error_mapping
+from src.app.bases.db import async_session_error_convert_wrapper, convert_integrity_error
+from src.app.main.db.context import ctx_session
+from src.app.main.db.exceptions import classify_error
 from src.core.exceptions import InitializationError
 from src.core.state import project_settings
 from src.core.utils.singleton import ABCSingletonMeta
@@ -14,11 +18,30 @@ from src.core.utils.singleton import ABCSingletonMeta
 _logger = getLogger(__name__)
 
 
+class _LoopDatabaseState:
+    """
+    Engine (with its connection pool) and related objects bound to a single event loop.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine: AsyncEngine = engine
+        self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            engine,
+            expire_on_commit=False,
+            autoflush=False
+        )
+        self.keepalive_task: asyncio.Task[None] | None = None
+
+
 class AsyncDatabaseManagerST(AbstractAsyncDatabaseManager, metaclass=ABCSingletonMeta):
     """
     A singleton database manager for managing asynchronous database connections and sessions.
 
-    Note: ASYNC INITIALISATION REQUIRED
+    Pooled connections can't be used outside the event loop they were created in, so each loop
+    (e.g. of a test or a sidecar thread) gets its own engine, while the manager itself stays a singleton.
+    Engines of loops closed without `close()` are dropped (with a warning) on the next initialization.
+
+    Note: ASYNC INITIALISATION REQUIRED (in every event loop the manager is used in)
     """
 
     def __init__(self) -> None:
@@ -27,8 +50,19 @@ class AsyncDatabaseManagerST(AbstractAsyncDatabaseManager, metaclass=ABCSingleto
         """
 
         self._database_url: str = project_settings.DATABASE_URL
-        self._engine: AsyncEngine | None = None
-        self._session_factory: Callable[[], AsyncSession] | None = None
+        self._loop_states: dict[asyncio.AbstractEventLoop, _LoopDatabaseState] = {}
+
+    def _drop_closed_loop_states(self) -> None:
+        # Pool of a closed loop can't be disposed anymore, but its references must not be kept forever
+        for loop in [loop for loop in self._loop_states if loop.is_closed()]:
+            _logger.warning(f"Event loop was closed without closing its {self.__class__.__name__} engine, dropping it")
+            del self._loop_states[loop]
+
+    def _get_loop_state(self) -> _LoopDatabaseState | None:
+        try:
+            return self._loop_states.get(asyncio.get_running_loop())
+        except RuntimeError:  # No running event loop
+            return None
 
     def __await__(self) -> Generator[Any, None, Self]:
         """
@@ -49,48 +83,139 @@ class AsyncDatabaseManagerST(AbstractAsyncDatabaseManager, metaclass=ABCSingleto
             The SQLAlchemy asynchronous engine instance.
 
         :raises InitializationError:
-            If the engine has not been initialized yet.
+            If the engine has not been initialized yet (in the running event loop).
         """
 
-        if self._engine is None:
+        if (state := self._get_loop_state()) is None:
             raise InitializationError(f"Unable to get async_engine: {self.__class__.__name__} is not initialized yet")
 
-        return self._engine
+        return state.engine
 
     async def initialize(self) -> Self:
         """
-        Asynchronously initializes the database engine and session factory.
+        Asynchronously initializes the database engine and session factory for the running event loop.
+        Does nothing if they are already initialized in this loop.
 
         :return: `Self`
             Initialized `AsyncDatabaseManagerST` instance.
         """
 
-        self._engine = create_async_engine(self._database_url, pool_pre_ping=True)
-        self._session_factory = sessionmaker(  # type: ignore
-            self.engine,
-            class_=AsyncSession,
-            expire_on_commit=False
-        )
+        # No `await` between this check and the state registration below, so concurrent
+        # initializations within a loop can never create (and leak) a second engine
+        if self._get_loop_state() is not None:
+            return self
+
+        self._drop_closed_loop_states()
+        state = self._loop_states[asyncio.get_running_loop()] = _LoopDatabaseState(create_async_engine(
+            self._database_url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_pre_ping=True,
+            pool_size=project_settings.DATABASE_POOL_SIZE,
+            max_overflow=project_settings.DATABASE_POOL_MAX_OVERFLOW,
+            pool_recycle=project_settings.DATABASE_POOL_RECYCLE,
+            pool_timeout=project_settings.DATABASE_POOL_TIMEOUT
+        ))
+
+        await self._ping_pool_connections(project_settings.DATABASE_POOL_WARMUP_SIZE)
+        state.keepalive_task = asyncio.create_task(self._pool_keepalive())
 
         return self
 
+    async def close(self) -> None:
+        """
+        Stops the pool keep-alive task and disposes the engine of the running event loop with all its connections.
+        """
+
+        if (state := self._loop_states.pop(asyncio.get_running_loop(), None)) is None:
+            return
+
+        if state.keepalive_task is not None:
+            state.keepalive_task.cancel()
+
+        await state.engine.dispose()
+
+    async def _ping_pool_connections(self, count: int) -> None:
+        """
+        Checks out `count` pool connections at once, pings them and returns them back to the pool.
+        Used to open connections on startup and to keep idle ones from being dropped by the server.
+
+        :param count: `int`
+            Number of connections to ping.
+        """
+
+        async def ping() -> None:
+            async with self.engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(ping() for _ in range(count)))
+
+    async def _pool_keepalive(self) -> None:
+        """
+        Periodically pings idle pool connections (see `DATABASE_POOL_KEEPALIVE_INTERVAL`).
+        """
+
+        while True:
+            await asyncio.sleep(project_settings.DATABASE_POOL_KEEPALIVE_INTERVAL)
+
+            try:
+                await self._ping_pool_connections(project_settings.DATABASE_POOL_WARMUP_SIZE)
+            except Exception as error:
+                _logger.warning(f"Failed to ping database pool connections: {error}")
+
+    def pool_status(self) -> str:
+        """
+        Returns a brief description of the connection pool state for monitoring.
+
+        :return: `str`
+            Pool status (size, checked in/out connections and overflow).
+
+        :raises InitializationError:
+            If the engine has not been initialized yet.
+        """
+
+        return self.engine.pool.status()
+
     def session(self) -> AsyncContextManager[AsyncSession]:
         """
         Provides an asynchronous session context manager for database requests.
         Session is wrapped with `async_session_error_convert_wrapper`
-        so it will convert some db errors based on `src.app.bases.db.exceptions.error_mapping`
+        so it will convert some db errors based on `src.app.main.db.exceptions.error_mapping`.
+
+        Sessions are scoped to the current context (see `ctx_session`): nested calls reuse the session
+        of the enclosing one instead of checking out another pool connection, and nested transactions become savepoints.
 
         :return: `AsyncContextManager[AsyncSession]`
             An asynchronous context manager for an SQLAlchemy session.
 
         :raises InitializationError:
-            If the session factory has not been initialized yet.
+            If the session factory has not been initialized yet (in the running event loop).
         """
 
-        if self._session_factory is None:
+        if (state := self._get_loop_state()) is None:
             raise InitializationError(f"Unable to get session: {self.__class__.__name__} is not initialized yet")
 
-        return async_session_error_convert_wrapper(
-            self._session_factory(),
-            error_mapping=error_mapping
-        )
+        if (session := ctx_session.get()) is not None:
+            return self._reuse_session(session)
+
+        return self._scoped_session(state.session_factory)
+
+    @asynccontextmanager
+    async def _reuse_session(self, session: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
+        # Closing is left to the context that opened the session, errors are converted right away for nested callers
+        try:
+            yield session
+        except IntegrityError as error:
+            raise convert_integrity_error(error, classify_error)
+
+    @asynccontextmanager
+    async def _scoped_session(self, session_factory: async_sessionmaker[AsyncSession]) -> AsyncGenerator[AsyncSession, None]:
+        async with async_session_error_convert_wrapper(
+            session_factory(),
+            classify_error=classify_error
+        ) as session:
+            token = ctx_session.set(session)
+
+            try:
+                yield session
+            finally:
+                ctx_session.reset(token)
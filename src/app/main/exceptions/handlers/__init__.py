@@ -1,3 +1,4 @@
+from src.app.bases.exceptions import AbstractErrorHandler
 from .application_http_error_handler import application_http_exception_handler
 from .does_not_exist_error_handler import does_not_exist_exception_handler
 from .http_error_handler import http_exception_handler
@@ -11,3 +12,7 @@ __handlers__ = [
     http_validation_exception_handler,
     does_not_exist_exception_handler
 ]
+
+# Exact exception class -> handler, so each class is registered once and duplicates fail loudly at import
+__handler_map__: dict[type[Exception], AbstractErrorHandler] = {handler.__exception_cls__: handler for handler in __handlers__}
+assert len(__handler_map__) == len(__handlers__), "Several error handlers are registered for the same exception class"
@@ -1,24 +1,44 @@
+from functools import lru_cache
+
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
+from starlette.responses import JSONResponse
 
 from src.app.bases.exceptions import AbstractErrorHandler
-from src.app.main.http.responses import ApplicationJsonResponse
+from src.app.main.http.responses import ApplicationJsonResponse, PrerenderedJsonResponse
 from src.app.main.models_global import ApplicationResponsePayload
 from src.core.state import project_settings
 from src.core.utils.types import JsonDict
 
 
+def _build_payload(status_code: int, message: str, detail: object) -> ApplicationResponsePayload[JsonDict]:
+    return ApplicationResponsePayload[JsonDict](
+        ok=200 <= status_code < 300,
+        application_status_code=project_settings.APPLICATION_STATUS_CODES.NOT_SPECIFIED,
+        message=message,
+        data={
+            "detail": detail
+        }
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_rendered_payload(status_code: int, message: str, detail: str) -> bytes:
+    # Most raises repeat a handful of (status code, detail) pairs (e.g. 404 / 405 from routing)
+    return PrerenderedJsonResponse.render_payload(_build_payload(status_code, message, detail))
+
+
 @AbstractErrorHandler.as_error_handler(exception_cls=HTTPException)
-async def http_exception_handler(_: Request, error: HTTPException, **__) -> ApplicationJsonResponse:
+async def http_exception_handler(_: Request, error: HTTPException, **__) -> JSONResponse:
+    if type(error.detail) is str:
+        return PrerenderedJsonResponse(
+            _get_rendered_payload(error.status_code, str(error), error.detail),
+            status_code=error.status_code,
+            headers=error.headers
+        )
+
     return ApplicationJsonResponse(
-        content=ApplicationResponsePayload[JsonDict](
-            ok=200 <= error.status_code < 300,
-            application_status_code=project_settings.APPLICATION_STATUS_CODES.NOT_SPECIFIED,
-            message=str(error),
-            data={
-                "detail": error.detail
-            }
-        ),
+        content=_build_payload(error.status_code, str(error), error.detail),
         status_code=error.status_code,
         headers=error.headers
     )
@@ -1,24 +1,40 @@
+from functools import cache
 from http import HTTPStatus
 
-from fastapi.encoders import jsonable_encoder
+import pydantic_core
 from fastapi.exceptions import RequestValidationError
 from starlette.requests import Request
 
 from src.app.bases.exceptions import AbstractErrorHandler
-from src.app.main.http.responses import ApplicationJsonResponse
+from src.app.main.http.responses import PrerenderedJsonResponse
 from src.app.main.models_global import ApplicationResponsePayload
 from src.core.state import project_settings
 from src.core.utils.types import JsonDict
 
+_RENDERED_NULL_DATA_SUFFIX = b'null}'
+
+
+@cache
+def _get_rendered_payload_prefix() -> bytes:
+    rendered = PrerenderedJsonResponse.render_payload(ApplicationResponsePayload[JsonDict](
+        ok=False,
+        data=None,
+        **project_settings.APPLICATION_STATUS_CODES.GENERIC_ERRORS.UNPROCESSABLE_ENTITY
+    ))
+
+    # `data` is the last payload field, so only its value differs between validation errors
+    assert rendered.endswith(_RENDERED_NULL_DATA_SUFFIX), "`data` must be the last field of `ApplicationResponsePayload`"
+    return rendered[:-len(_RENDERED_NULL_DATA_SUFFIX)]
+
 
 @AbstractErrorHandler.as_error_handler(exception_cls=RequestValidationError)
-async def http_validation_exception_handler(_: Request, exc: RequestValidationError, **__) -> ApplicationJsonResponse:
-    return ApplicationJsonResponse(
-        content=ApplicationResponsePayload[JsonDict](
-            ok=False,
-            data={"detail": jsonable_encoder(exc.errors())},
-            **project_settings.APPLICATION_STATUS_CODES.GENERIC_ERRORS.UNPROCESSABLE_ENTITY
-        ),
+async def http_validation_exception_handler(_: Request, exc: RequestValidationError, **__) -> PrerenderedJsonResponse:
+    # Unknown objects in error inputs/contexts (e.g. exceptions in `ctx`) are rendered as strings. Unlike orjson,
+    # pydantic-core also encodes integers wider than 64 bits, which are ordinary malformed client input here
+    detail = pydantic_core.to_json({"detail": exc.errors()}, fallback=str)
+
+    return PrerenderedJsonResponse(
+        _get_rendered_payload_prefix() + detail + b'}',
         status_code=HTTPStatus.UNPROCESSABLE_ENTITY
     )
 
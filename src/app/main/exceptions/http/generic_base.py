@@ -5,12 +5,19 @@ from typing import Any
 from src.app.main.models_global import ApplicationResponsePayload
 from .base import ApplicationHTTPException
 
+_default_payloads_cache: dict[type, ApplicationResponsePayload] = {}
+
 
 class GenericApplicationHTTPException[_contentT: Any](ApplicationHTTPException[_contentT], ABC):
     """
     A generic exception class for HTTP errors that includes a customizable response payload.
+
+    Subclasses whose default payload doesn't depend on instance state may set `__cache_default_payload__`
+    to reuse a single payload instance, so frequently raised errors skip payload validation.
     """
 
+    __cache_default_payload__: bool = False
+
     def __init__(
             self,
             *,
@@ -20,10 +27,29 @@ class GenericApplicationHTTPException[_contentT: Any](ApplicationHTTPException[_
             **payload_kwargs
     ) -> None:
         if payload is None:
-            payload = self.get_default_response_payload(**payload_kwargs)
+            payload = self._get_default_response_payload(**payload_kwargs)
 
         super().__init__(payload=payload, status_code=status_code, headers=headers)
 
+    def _get_default_response_payload(self, **payload_kwargs) -> ApplicationResponsePayload[_contentT]:
+        """
+        Returns the default response payload, reusing a cached instance when allowed.
+
+        :param payload_kwargs: `dict`
+            Additional keyword arguments for customizing the default response payload.
+
+        :return: `ApplicationResponsePayload[_contentT]`
+            The default payload for the error response.
+        """
+
+        if not self.__cache_default_payload__ or payload_kwargs:
+            return self.get_default_response_payload(**payload_kwargs)
+
+        if (payload := _default_payloads_cache.get(type(self))) is None:
+            payload = _default_payloads_cache[type(self)] = self.get_default_response_payload()
+
+        return payload
+
     @abstractmethod
     def get_default_response_payload(self, **payload_kwargs) -> ApplicationResponsePayload[_contentT]:
         """
@@ -1,2 +1,3 @@
+from .dependencies import *
 from .responses import *
 from .routing import *
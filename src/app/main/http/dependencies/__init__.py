@@ -0,0 +1 @@
+from .json_body import JsonBodyDependency
@@ -1,5 +1,6 @@
 from .application_json_response import ApplicationJsonResponse
 from .generic_base import BaseGenericApplicationJsonResponse, GenericApplicationJsonResponse
+from .prerendered_json_response import PrerenderedJsonResponse
 from .generics import (
     SuccessResponse,
     UpdatedResponse,
@@ -35,4 +35,5 @@ class ApplicationJsonResponse[_contentT: Any](JSONResponse):
             The JSON-encoded byte string of the payload.
         """
 
-        return content.model_dump_json().encode(self.charset)
+        # The serializer emits UTF-8 JSON bytes directly, skipping `model_dump_json`'s str round-trip
+        return content.__pydantic_serializer__.to_json(content)
@@ -81,6 +81,9 @@ class GenericApplicationJsonResponse[_contentT: Any](BaseGenericApplicationJsonR
     default_status_code: int
     default_status_info_path: str
 
+    _default_payload_template: dict[str, Any] | None = None
+    _rendered_default_payload: tuple[ApplicationResponsePayload, bytes] | None = None
+
     def __init__(self, **kwargs) -> None:
         """
         Initializes the response using default class-level settings and any provided arguments.
@@ -103,11 +106,60 @@ class GenericApplicationJsonResponse[_contentT: Any](BaseGenericApplicationJsonR
             The default response payload.
         """
 
-        path = getattr(self.__class__, "default_status_info_path").split(".")
-        default_status_info = reduce(getattr, path, project_settings.APPLICATION_STATUS_CODES)
+        if not payload_kwargs:
+            return self._get_rendered_default_payload()[0]
 
         return ApplicationResponsePayload(**{
-            "ok": getattr(self.__class__, "default_ok"),
-            **default_status_info,
+            **self._get_default_payload_template(),
             **payload_kwargs
         })
+
+    def render(self, content: ApplicationResponsePayload[_contentT]) -> bytes:
+        """
+        Renders the content into a JSON-encoded byte string, reusing the rendered default payload.
+
+        :param content: `ApplicationResponsePayload[_contentT]`
+            The payload to be serialized into a JSON string.
+
+        :return: `bytes`
+            The JSON-encoded byte string of the payload.
+        """
+
+        default_payload, rendered_default_payload = self._get_rendered_default_payload()
+        return rendered_default_payload if content is default_payload else super().render(content)
+
+    @classmethod
+    def _get_rendered_default_payload(cls) -> tuple[ApplicationResponsePayload, bytes]:
+        """
+        Returns the payload used when no payload arguments are given (shared by all responses of this class)
+        along with its rendered body, so such responses skip validation and serialization entirely.
+
+        :return: `tuple[ApplicationResponsePayload, bytes]`
+            The default payload and its JSON-encoded byte string.
+        """
+
+        if (rendered := cls.__dict__.get("_rendered_default_payload")) is None:
+            payload: ApplicationResponsePayload[Any] = ApplicationResponsePayload(**cls._get_default_payload_template())
+            rendered = cls._rendered_default_payload = (payload, payload.__pydantic_serializer__.to_json(payload))
+
+        return rendered
+
+    @classmethod
+    def _get_default_payload_template(cls) -> dict[str, Any]:
+        """
+        Returns the default payload fields of this class, resolving `default_status_info_path` only once.
+        Resolved lazily, as status codes are loaded into the settings at startup.
+
+        :return: `dict[str, Any]`
+            The default `ok` status along with the status information.
+        """
+
+        # Looked up in the own `__dict__`, so subclasses never reuse a parent's template
+        if (template := cls.__dict__.get("_default_payload_template")) is None:
+            path = cls.default_status_info_path.split(".")
+            default_status_info = reduce(getattr, path, project_settings.APPLICATION_STATUS_CODES)
+
+            template = {"ok": cls.default_ok, **default_status_info}
+            cls._default_payload_template = template
+
+        return template
@@ -0,0 +1,49 @@
+from fastapi.responses import JSONResponse
+
+from src.app.main.models_global import ApplicationResponsePayload
+
+
+class PrerenderedJsonResponse(JSONResponse):
+    """
+    A JSON response whose body has already been rendered (e.g. a static payload rendered once and reused).
+    """
+
+    def __init__(self, rendered: bytes, **kwargs) -> None:
+        """
+        Initializes the response with an already rendered body.
+
+        :param rendered: `bytes`
+            The JSON-encoded body of the response.
+
+        :param kwargs: `**kwargs`
+            Additional keyword arguments passed to the parent class `JSONResponse`.
+        """
+
+        super().__init__(rendered, **kwargs)
+
+    def render(self, content: bytes) -> bytes:
+        """
+        Returns the already rendered body as is.
+
+        :param content: `bytes`
+            The JSON-encoded body of the response.
+
+        :return: `bytes`
+            The same JSON-encoded body.
+        """
+
+        return content
+
+    @classmethod
+    def render_payload(cls, payload: ApplicationResponsePayload) -> bytes:
+        """
+        Renders the payload the same way `ApplicationJsonResponse` does, so the result can be reused.
+
+        :param payload: `ApplicationResponsePayload`
+            The payload to be serialized into a JSON string.
+
+        :return: `bytes`
+            The JSON-encoded byte string of the payload.
+        """
+
+        return payload.__pydantic_serializer__.to_json(payload)
@@ -13,10 +13,11 @@ class ApplicationResponsePayload[_contentT: Any](BaseSchema):
     data: _contentT | None = None
 
     # noinspection PyNestedDecorators
-    @field_serializer('data')
+    @field_serializer('data', when_used="json")
     @classmethod
     def serialize_data(cls, value: _contentT | None) -> JsonDict | None:
-        if value is None:
-            return None
+        # Plain dicts (most handlers) and `None` are checked first, as they need no conversion
+        if value is None or type(value) is dict:
+            return value  # type: ignore
 
         return value.model_dump() if isinstance(value, BaseSchema) else value  # type: ignore
@@ -1,9 +1,12 @@
-import json
 import logging
+from contextlib import aclosing
 from typing import AsyncGenerator, Type
 
+import orjson
+
 from src.app.bases.db import BaseSchema
 from src.app.main.redis.redis_client_mixin import RedisClientMixin
+from src.core.state import project_settings
 from src.core.utils.types import JsonDict
 
 _logger = logging.getLogger(__name__)
@@ -24,41 +27,82 @@ class RedisQueue[schemaT: BaseSchema](RedisClientMixin):
         self._overflow_buffer: int = overflow_buffer
         self._max_size: int = max_size
         self._key: str = key
+        self._writes_since_trim: int = 0
 
-    async def _write_data(self, data: str) -> None:
+    async def _write_data(self, data: str | bytes) -> None:
         redis = await self.get_redis()
+        self._writes_since_trim += 1
+
+        # Queue may outgrow `max_size` by up to `overflow_buffer` items, so it's trimmed only once per that many writes
+        if self._writes_since_trim < self._overflow_buffer:
+            await redis.rpush(self._key, data)  # type: ignore
+            return
+
+        self._writes_since_trim = 0
 
-        new_size = await redis.rpush(self._key, data)  # type: ignore
-        if new_size > self._max_size:
-            await redis.ltrim(self._key, self._max_size - self._overflow_buffer, -1)  # type: ignore
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.rpush(self._key, data)
+            pipe.ltrim(self._key, -self._max_size, -1)  # Keeps the newest `max_size` items
+            await pipe.execute()
 
     async def _write_json(self, data: JsonDict) -> None:
-        await self._write_data(json.dumps(data))
+        await self._write_data(orjson.dumps(data))
 
-    async def _data_stream(self, *, timeout: int = 0) -> AsyncGenerator[str | None, None]:
+    async def _pop_data(self, *, timeout: int, batch_size: int) -> list[str] | None:
         redis = await self.get_redis()
 
+        if project_settings.REDIS_USE_BLMPOP:
+            # Blocks until items arrive and pops up to `batch_size` of them in a single command
+            result = await redis.blmpop(timeout, 1, self._key, direction="LEFT", count=batch_size)  # type: ignore
+            return None if result is None else result[1]
+
+        result = await redis.blpop([self._key], timeout=timeout)  # type: ignore
+        return None if result is None else [result[1]]
+
+    async def _data_stream(self, *, timeout: int = 0, batch_size: int = 64) -> AsyncGenerator[str | None, None]:
+        # Up to `batch_size` items are popped ahead of consumption. If the consumer stops mid-batch, the unconsumed
+        # rest is pushed back to the queue head in its original order, but items taken by other consumers in the
+        # meantime are then handled before it. Pass `batch_size=1` where strict FIFO across consumers matters
         while True:
-            data = await redis.blpop([self._key], timeout=timeout)  # type: ignore
-            yield None if data is None else data[1]
+            if (items := await self._pop_data(timeout=timeout, batch_size=batch_size)) is None:
+                yield None
+                continue
+
+            for index, data in enumerate(items):
+                try:
+                    yield data
+                except GeneratorExit:
+                    if remaining := items[index + 1:]:
+                        # LPUSH prepends its arguments one by one, so they are passed reversed to keep the batch order
+                        redis = await self.get_redis()
+                        await redis.lpush(self._key, *reversed(remaining))  # type: ignore
+
+                    raise
 
     async def _json_stream(self, **kwargs) -> AsyncGenerator[JsonDict | None, None]:
-        async for data in self._data_stream(**kwargs):  # type: ignore
-            yield None if data is None else json.loads(data)
+        async with aclosing(self._data_stream(**kwargs)) as data_stream:
+            async for data in data_stream:  # type: ignore
+                yield None if data is None else orjson.loads(data)
 
     async def write(self, schema: schemaT, **kwargs) -> None:
         if not isinstance(schema, self._schema_cls):
             raise TypeError(f"{self.__class__.__name__} can only contain objects of type {self._schema_cls.__name__}")
 
-        await self._write_data(schema.model_dump_json(**kwargs))
+        # Serialized straight to bytes, skipping `model_dump_json`'s str round-trip
+        await self._write_data(schema.__pydantic_serializer__.to_json(schema, **kwargs))
 
     async def stream(self, **kwargs) -> AsyncGenerator[schemaT | None, None]:
-        async for data in self._json_stream(**kwargs):
-            yield None if data is None else self._schema_cls.model_validate(data)
+        # Parsed and validated in a single pass, without building an intermediate dict
+        async with aclosing(self._data_stream(**kwargs)) as data_stream:
+            async for data in data_stream:
+                yield None if data is None else self._schema_cls.model_validate_json(data)
 
     async def wait(self, **kwargs) -> schemaT | None:
-        async for item in self.stream(**kwargs):
-            return item
+        kwargs["batch_size"] = 1  # Pops only the awaited item
+
+        async with aclosing(self.stream(**kwargs)) as stream:
+            async for item in stream:
+                return item
 
     async def size(self) -> int:
         redis = await self.get_redis()
@@ -73,17 +117,15 @@ class RedisQueue[schemaT: BaseSchema](RedisClientMixin):
         if (data := await redis.lindex(self._key, index)) is None:  # type: ignore
             return None
 
-        json_data = json.loads(data)
-        return self._schema_cls.model_validate(json_data)
+        return self._schema_cls.model_validate_json(data)
 
     async def drain(self) -> list[schemaT]:
         redis = await self.get_redis()
 
-        items: list[schemaT] = []
-        while True:
-            if (data := await redis.lpop(self._key)) is None:  # type: ignore
-                break
+        # Whole queue is read and removed atomically in a single round-trip
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.lrange(self._key, 0, -1)
+            pipe.delete(self._key)
+            raw_items, _ = await pipe.execute()
 
-            json_data = json.loads(data)
-            items.append(self._schema_cls.model_validate(json_data))
-        return items
+        return [self._schema_cls.model_validate_json(data) for data in raw_items]
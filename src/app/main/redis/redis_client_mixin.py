@@ -1,26 +1,61 @@
 import logging
 
 from redis import asyncio as aioredis
+from redis.commands.core import AsyncScript
 
 from src.core.state import project_settings
 
 _logger = logging.getLogger(__name__)
 
+# Connection pools shared by all clients of the process, keyed by (db, max_connections, decode_responses)
+_pools: dict[tuple[int, int | None, bool], aioredis.ConnectionPool] = {}
+
+
+def _get_pool(db: int, max_connections: int | None = None, decode_responses: bool = True) -> aioredis.ConnectionPool:
+    if (pool := _pools.get((db, max_connections, decode_responses))) is None:
+        pool = _pools[(db, max_connections, decode_responses)] = aioredis.ConnectionPool.from_url(
+            url=project_settings.REDIS_BASE_URL + f"{db}/",
+            encoding=project_settings.REDIS_ENCODING,
+            decode_responses=decode_responses,
+            max_connections=max_connections
+        )
+
+    return pool
+
 
 class RedisClientMixin:
-    def __init__(self, db: int = 0) -> None:
+    def __init__(self, db: int = 0, blocking_pool_size: int | None = None, blocking_decode_responses: bool = True) -> None:
         self._db: int = db
+        self._blocking_pool_size: int | None = blocking_pool_size
+        self._blocking_decode_responses: bool = blocking_decode_responses
         self._redis: aioredis.client.Redis | None = None
+        self._blocking_redis: aioredis.client.Redis | None = None
+        self._scripts: dict[str, AsyncScript] = {}
 
-    async def _create_redis(self) -> aioredis.client.Redis:
-        return await aioredis.from_url(
-            url=project_settings.REDIS_BASE_URL + f"{self._db}/",
-            encoding=project_settings.REDIS_ENCODING,
-            decode_responses=True
-        )
+    def _create_redis(self, max_connections: int | None = None, decode_responses: bool = True) -> aioredis.client.Redis:
+        # Clients are cheap handles over the shared pool, so creating one never suspends (and can't race)
+        return aioredis.Redis(connection_pool=_get_pool(self._db, max_connections, decode_responses))
 
     async def get_redis(self) -> aioredis.client.Redis:
         if self._redis is None:
-            self._redis = await self._create_redis()
+            self._redis = self._create_redis()
 
         return self._redis
+
+    async def get_blocking_redis(self) -> aioredis.client.Redis:
+        # Separate pool for blocking commands (BLPOP, XREAD BLOCK), so long waits never hold connections of short ones
+        if self._blocking_redis is None:
+            self._blocking_redis = self._create_redis(
+                max_connections=self._blocking_pool_size,
+                decode_responses=self._blocking_decode_responses
+            )
+
+        return self._blocking_redis
+
+    async def get_script(self, script: str) -> AsyncScript:
+        # Registered once; calls go through EVALSHA and fall back to EVAL on NOSCRIPT
+        if (registered_script := self._scripts.get(script)) is None:
+            redis = await self.get_redis()
+            registered_script = self._scripts[script] = redis.register_script(script)
+
+        return registered_script
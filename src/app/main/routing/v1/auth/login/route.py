@@ -1,5 +1,6 @@
 from starlette.requests import Request
 
+from src.app.bases.http.connection import get_client_host, get_user_agent
 from src.app.main.components.auth.entities.auth_session import AuthSessionPrivate
 from src.app.main.components.auth.entities.user import UserPrivate
 from src.app.main.components.auth.services.auth_service import AuthServiceST
@@ -13,19 +14,21 @@ _auth_service = AuthServiceST()
 
 @auth_router.post("/login/")
 async def login_route(request: Request, payload: LoginRequestPayload) -> ApplicationJsonResponse:
-    if request.client is None:
+    if (client_host := get_client_host(request)) is None:
         raise ForbiddenHTTPException(message="Client is unknown")
 
     auth_info, auth_token_pair = await _auth_service.login(
-        ip_address=request.client.host,
-        user_agent=request.headers.get("User-Agent", "unknown"),
-        **payload.model_dump()
+        ip_address=client_host,
+        user_agent=get_user_agent(request),
+        username=payload.username,
+        password=payload.password,
+        session_name=payload.session_name
     )
 
     return SuccessResponse(
         data=LoginResponsePayload(
-            user=auth_info.user.convert_to(UserPrivate),
-            session=auth_info.session.convert_to(AuthSessionPrivate),
+            user=UserPrivate.project_from(auth_info.user),
+            session=AuthSessionPrivate.project_from(auth_info.session),
             access_token=auth_token_pair.access_token,
             refresh_token=auth_token_pair.refresh_token
         )
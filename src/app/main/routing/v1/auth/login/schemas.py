@@ -6,8 +6,8 @@ from src.app.main.components.auth.entities.user import UserPrivate
 
 
 class LoginRequestPayload(BaseSchema):
-    username: str
-    session_name: str
+    username: str = Field(..., max_length=50)
+    session_name: str = Field(..., max_length=50)
     password: str = Field(..., max_length=50)
 
 
@@ -2,15 +2,15 @@ from fastapi import Depends
 
 from src.app.main.components.auth.entities.auth_info import AuthInfo
 from src.app.main.components.auth.services.auth_service import AuthServiceST
-from src.app.main.components.auth.utils.dependencies.http_auth import HTTPJWTBearerAuthDependency
+from src.app.main.components.auth.utils.dependencies import jwt_auth
 from src.app.main.http import ApplicationJsonResponse, SuccessResponse
 from ..router import auth_router
 
-_jwt_auth = HTTPJWTBearerAuthDependency()
 _auth_service = AuthServiceST()
+_success_response = SuccessResponse[None]
 
 
 @auth_router.get("/logout/")
-async def logout_route(auth_info: AuthInfo = Depends(_jwt_auth)) -> ApplicationJsonResponse:
+async def logout_route(auth_info: AuthInfo = Depends(jwt_auth)) -> ApplicationJsonResponse:
     await _auth_service.revoke_session(auth_info.user.id, auth_info.session.session_uuid)
-    return SuccessResponse[None]()
+    return _success_response()
@@ -1,5 +1,6 @@
 from starlette.requests import Request
 
+from src.app.bases.http.connection import get_client_host, get_user_agent
 from src.app.main.components.auth.services.auth_service import AuthServiceST
 from src.app.main.exceptions import ForbiddenHTTPException
 from src.app.main.http import ApplicationJsonResponse, SuccessResponse
@@ -7,20 +8,21 @@ from .schemas import RefreshRequestPayload, RefreshResponsePayload
 from ..router import auth_router
 
 _auth_service = AuthServiceST()
+_success_response = SuccessResponse[RefreshResponsePayload]
 
 
 @auth_router.post("/refresh/")
 async def refresh_route(payload: RefreshRequestPayload, request: Request) -> ApplicationJsonResponse:
-    if request.client is None:
+    if (client_host := get_client_host(request)) is None:
         raise ForbiddenHTTPException(message="Client is unknown")
 
     auth_token_pair = await _auth_service.refresh(
-        current_client_ip=request.client.host,
-        current_client_user_agent=request.headers.get("User-Agent", "unknown"),
+        current_client_ip=client_host,
+        current_client_user_agent=get_user_agent(request),
         refresh_token=payload.refresh_token
     )
 
-    return SuccessResponse[RefreshResponsePayload](
+    return _success_response(
         data=RefreshResponsePayload(
             access_token=auth_token_pair.access_token,
             refresh_token=auth_token_pair.refresh_token
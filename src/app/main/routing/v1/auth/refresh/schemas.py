@@ -4,7 +4,7 @@ from src.app.bases.db import BaseSchema
 
 
 class RefreshRequestPayload(BaseSchema):
-    refresh_token: str = Field(..., max_length=1000)
+    refresh_token: str = Field(..., min_length=20, max_length=1000)  # Rejects obvious garbage before decoding
 
 
 class RefreshResponsePayload(BaseSchema):
@@ -1,5 +1,6 @@
 from starlette.requests import Request
 
+from src.app.bases.http.connection import get_client_host, get_user_agent
 from src.app.main.components.auth.entities.auth_session import AuthSessionPrivate
 from src.app.main.components.auth.entities.user import UserPrivate
 from src.app.main.components.auth.services.auth_service import AuthServiceST
@@ -9,23 +10,26 @@ from .schemas import RegisterReqeustPayload, RegisterResponsePayload
 from ..router import auth_router
 
 _auth_service = AuthServiceST()
+_created_response = CreatedResponse[RegisterResponsePayload]
 
 
 @auth_router.post("/register/")
 async def register_route(request: Request, payload: RegisterReqeustPayload) -> ApplicationJsonResponse:
-    if request.client is None:
+    if (client_host := get_client_host(request)) is None:
         raise ForbiddenHTTPException(message="Client is unknown")
 
     auth_info, auth_token_pair = await _auth_service.register(
-        ip_address=request.client.host,
-        user_agent=request.headers.get("User-Agent", "unknown"),
-        **payload.model_dump()
+        ip_address=client_host,
+        user_agent=get_user_agent(request),
+        username=payload.username,
+        password=payload.password,
+        session_name=payload.session_name
     )
 
-    return CreatedResponse[RegisterResponsePayload](
+    return _created_response(
         data=RegisterResponsePayload(
-            user=auth_info.user.convert_to(UserPrivate),
-            session=auth_info.session.convert_to(AuthSessionPrivate),
+            user=UserPrivate.project_from(auth_info.user),
+            session=AuthSessionPrivate.project_from(auth_info.session),
             access_token=auth_token_pair.access_token,
             refresh_token=auth_token_pair.refresh_token
         )
@@ -1,16 +1,16 @@
-from fastapi import Depends
+from fastapi import Depends, Query
 from starlette.requests import Request
 
-from src.app.bases.http.connection import cancel_on_disconnect
+from src.app.bases.http.connection import cancel_on_disconnect_for
 from src.app.main.components.auth.entities.auth_info import AuthInfo
-from src.app.main.components.auth.utils.dependencies.http_auth import HTTPJWTBearerAuthDependency
+from src.app.main.components.auth.utils.dependencies import jwt_auth
 from src.app.main.components.storage.services.storage_service import StorageServiceST
 from src.app.main.http import ApplicationJsonResponse, SuccessResponse
 from .schemas import ListenChannelResponsePayload
 from ..router import storage_router
 
-_jwt_auth = HTTPJWTBearerAuthDependency()
 _storage_service = StorageServiceST()
+_success_response = SuccessResponse[ListenChannelResponsePayload]
 
 
 @storage_router.get("/channel/{channel_name}/listen/")
@@ -19,19 +19,22 @@ async def channel_listen_route(
         request: Request,
         offset_id: int = 0,
         limit: int = 10,
-        timeout: int = 60,
-        auth_info: AuthInfo = Depends(_jwt_auth)
+        timeout: int = Query(60, ge=0),  # 0 means "wait forever"
+        auth_info: AuthInfo = Depends(jwt_auth)
 ) -> ApplicationJsonResponse:
-    async with cancel_on_disconnect(request):
-        messages = await _storage_service.listen_channel(
+    timeout = min(timeout, 60)
+
+    async with cancel_on_disconnect_for(request, timeout):
+        # Collected straight into a list, which the payload takes without another conversion
+        messages = [message async for message in _storage_service.iter_channel(
             user_id=auth_info.user.id,
             channel_name=channel_name,
-            offset_id=offset_id if offset_id > 0 else 0,
-            timeout=timeout if timeout <= 60 else 60,
-            limit=limit if limit <= 20 else 20
-        )
+            offset_id=max(offset_id, 0),
+            timeout=timeout,
+            limit=min(limit, 20)
+        )]
 
-    return SuccessResponse[ListenChannelResponsePayload](
+    return _success_response(
         data=ListenChannelResponsePayload(
             messages=messages
         )
@@ -3,4 +3,4 @@ from src.app.main.components.storage.entities.channel_message.schemas import Sto
 
 
 class ListenChannelResponsePayload(BaseSchema):
-    messages: tuple[StorageChannelMessage, ...]
+    messages: list[StorageChannelMessage]
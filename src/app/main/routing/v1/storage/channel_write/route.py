@@ -1,21 +1,21 @@
 from fastapi import Depends
 
 from src.app.main.components.auth.entities.auth_info import AuthInfo
-from src.app.main.components.auth.utils.dependencies.http_auth import HTTPJWTBearerAuthDependency
+from src.app.main.components.auth.utils.dependencies import jwt_auth
 from src.app.main.components.storage.services.storage_service import StorageServiceST
 from src.app.main.http import ApplicationJsonResponse, SuccessResponse
 from .schemas import WriteToChannelRequestPayload, WriteToChannelResponsePayload
 from ..router import storage_router
 
-_jwt_auth = HTTPJWTBearerAuthDependency()
 _storage_service = StorageServiceST()
+_success_response = SuccessResponse[WriteToChannelResponsePayload]
 
 
 @storage_router.post("/channel/{channel_name}/write/")
 async def channel_write_route(
         channel_name: str,
         payload: WriteToChannelRequestPayload,
-        auth_info: AuthInfo = Depends(_jwt_auth)
+        auth_info: AuthInfo = Depends(jwt_auth)
 ) -> ApplicationJsonResponse:
     message = await _storage_service.write_to_channel(
         user_id=auth_info.user.id,
@@ -23,7 +23,7 @@ async def channel_write_route(
         **payload.message.to_json_dict()
     )
 
-    return SuccessResponse[WriteToChannelResponsePayload](
+    return _success_response(
         data=WriteToChannelResponsePayload(
             message=message
         )
@@ -3,4 +3,4 @@ from src.app.main.components.storage.entities import StorageDirectMessage
 
 
 class ListenDirectResponsePayload(BaseSchema):
-    messages: tuple[StorageDirectMessage, ...]
+    messages: list[StorageDirectMessage]
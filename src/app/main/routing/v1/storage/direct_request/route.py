@@ -3,21 +3,22 @@ from starlette.requests import Request
 
 from src.app.bases.http.connection import cancel_on_disconnect
 from src.app.main.components.auth.entities.auth_info import AuthInfo
-from src.app.main.components.auth.utils.dependencies.http_auth import HTTPJWTBearerAuthDependency
+from src.app.main.components.auth.utils.dependencies import jwt_auth
 from src.app.main.components.storage.services.storage_service import StorageServiceST
-from src.app.main.http import ApplicationJsonResponse, SuccessResponse
+from src.app.main.http import ApplicationJsonResponse, JsonBodyDependency, SuccessResponse
 from .schemas import ResponsePayload, RequestPayload
 from ..router import storage_router
 
-_jwt_auth = HTTPJWTBearerAuthDependency()
 _storage_service = StorageServiceST()
+_json_body = JsonBodyDependency(RequestPayload)
+_success_response = SuccessResponse[ResponsePayload]
 
 
-@storage_router.post("/direct/request/")
+@storage_router.post("/direct/request/", openapi_extra=_json_body.openapi_extra)
 async def direct_request_route(
-        payload: RequestPayload,
         request: Request,
-        auth_info: AuthInfo = Depends(_jwt_auth),
+        auth_info: AuthInfo = Depends(jwt_auth),
+        payload: RequestPayload = Depends(_json_body),
 ) -> ApplicationJsonResponse:
     async with cancel_on_disconnect(request):
         response = await _storage_service.send_request(
@@ -26,7 +27,7 @@ async def direct_request_route(
             **payload.message.to_json_dict()
         )
 
-    return SuccessResponse[ResponsePayload](
+    return _success_response(
         data=ResponsePayload(
             responded=response is not None,
             response=response
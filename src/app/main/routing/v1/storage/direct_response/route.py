@@ -1,20 +1,21 @@
 from fastapi import Depends
 
 from src.app.main.components.auth.entities.auth_info import AuthInfo
-from src.app.main.components.auth.utils.dependencies.http_auth import HTTPJWTBearerAuthDependency
+from src.app.main.components.auth.utils.dependencies import jwt_auth
 from src.app.main.components.storage.services.storage_service import StorageServiceST
-from src.app.main.http import ApplicationJsonResponse, SuccessResponse
+from src.app.main.http import ApplicationJsonResponse, JsonBodyDependency, SuccessResponse
 from .schemas import RequestPayload
 from ..router import storage_router
 
-_jwt_auth = HTTPJWTBearerAuthDependency()
 _storage_service = StorageServiceST()
+_json_body = JsonBodyDependency(RequestPayload)
+_success_response = SuccessResponse[None]
 
 
-@storage_router.post("/direct/response/")
+@storage_router.post("/direct/response/", openapi_extra=_json_body.openapi_extra)
 async def direct_response_route(
-        payload: RequestPayload,
-        auth_info: AuthInfo = Depends(_jwt_auth),
+        auth_info: AuthInfo = Depends(jwt_auth),
+        payload: RequestPayload = Depends(_json_body),
 ) -> ApplicationJsonResponse:
     await _storage_service.send_response(
         user_id=auth_info.user.id,
@@ -22,4 +23,4 @@ async def direct_response_route(
         **payload.message.to_json_dict(),
     )
 
-    return SuccessResponse[None]()
+    return _success_response()
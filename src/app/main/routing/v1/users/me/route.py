@@ -2,18 +2,18 @@ from fastapi import Depends
 
 from src.app.main.components.auth.entities.auth_info import AuthInfo
 from src.app.main.components.auth.entities.user import UserPrivate
-from src.app.main.components.auth.utils.dependencies.http_auth import HTTPJWTBearerAuthDependency
+from src.app.main.components.auth.utils.dependencies import jwt_auth
 from src.app.main.http import ApplicationJsonResponse, SuccessResponse
 from .schemas import GetMeResponsePayload
 from ..router import users_router
 
-_jwt_auth = HTTPJWTBearerAuthDependency()
+_success_response = SuccessResponse[GetMeResponsePayload]
 
 
 @users_router.get("/me/")
-async def get_me_route(auth_info: AuthInfo = Depends(_jwt_auth)) -> ApplicationJsonResponse:
-    return SuccessResponse[GetMeResponsePayload](
+async def get_me_route(auth_info: AuthInfo = Depends(jwt_auth)) -> ApplicationJsonResponse:
+    return _success_response(
         data=GetMeResponsePayload(
-            user=auth_info.user.convert_to(UserPrivate)
+            user=UserPrivate.project_from(auth_info.user)
         )
     )
@@ -1,7 +1,18 @@
+from functools import cache
+
 from src.app.main.http import ApplicationJsonResponse, SuccessResponse
+from src.app.main.models_global import ApplicationResponsePayload
 from ..router import utils_router
 
+_success_response = SuccessResponse[str]
+
+
+@cache
+def _get_pong_payload() -> ApplicationResponsePayload:
+    # Liveness probes hit this constantly, so the payload is built once and only serialized per request
+    return _success_response(data={"result": "Pong"}).payload
+
 
 @utils_router.get("/ping/")
 async def ping_route() -> ApplicationJsonResponse:
-    return SuccessResponse[str](data={"result": "Pong"})
+    return _success_response(payload=_get_pong_payload())
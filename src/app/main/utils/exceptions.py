@@ -3,10 +3,20 @@ from typing import Generator
 from src.app.bases.db import BaseModel
 from src.app.main.exceptions.http.generics import NotFoundHTTPException
 
+_DEFAULT_NOT_FOUND_MESSAGE = "Requested object not found"
+
 
 @contextmanager
 def fetch_or_404(message: str | None = None) -> Generator[None, None, None]:
+    # Prefer `raise_404_if_none` with non-strict getters: a miss then costs a None check instead of an exception
     try:
         yield
     except BaseModel.DoesNotExist as error:
-        raise NotFoundHTTPException(message=message if message is not None else "Requested object not found") from error
+        raise NotFoundHTTPException(message=message if message is not None else _DEFAULT_NOT_FOUND_MESSAGE) from error
+
+
+def raise_404_if_none[_T](obj: _T | None, message: str | None = None) -> _T:
+    if obj is None:
+        raise NotFoundHTTPException(message=message if message is not None else _DEFAULT_NOT_FOUND_MESSAGE)
+
+    return obj
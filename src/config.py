@@ -43,16 +43,47 @@ APPLICATION_LOG_BACKUP_COUNT = 2  # 2 backup files
 # Server
 HOST = "0.0.0.0"
 PORT = 8000
+HTTP_GZIP_MINIMUM_SIZE = 1024  # 1KB. Smaller bodies are sent uncompressed
+
+# Database
+DATABASE_POOL_SIZE = 20
+DATABASE_POOL_MAX_OVERFLOW = 40
+DATABASE_POOL_RECYCLE = 60 * 60  # 1h
+DATABASE_POOL_TIMEOUT = 30  # 30s
+DATABASE_POOL_WARMUP_SIZE = 5  # Connections opened on startup and kept alive while idle
+DATABASE_POOL_KEEPALIVE_INTERVAL = DATABASE_POOL_RECYCLE // 2  # 30m
 
 # Redis
 REDIS_ENCODING = ENCODING
+REDIS_USE_BLMPOP = True  # Requires Redis 7.0+
 
 # Auth
 ACCESS_TOKEN_TTL = 24 * 60 * 60  # 24h
 REFRESH_TOKEN_TTL = 90 * 60 * 60 * 24  # 90d
 AUTH_REDIS_DB_ID = 0
 AUTH_REDIS_KEY = "auth"
+AUTH_USER_CACHE_TTL = 30  # 30s
+AUTH_USER_CACHE_SIZE = 10000
+AUTH_USER_REDIS_CACHE_TTL = 300  # 5m. Shared by all workers
+AUTH_TOKEN_CACHE_TTL = 60  # 60s
+AUTH_TOKEN_CACHE_SIZE = 10000
+AUTH_INFO_CACHE_TTL = 5  # 5s. Upper bound on revocation delay while a worker misses revocation events
+AUTH_INFO_CACHE_SIZE = 10000
+AUTH_SESSION_HEARTBEAT_RESOLUTION = 30  # 30s
+AUTH_REVOCATION_CHANNEL = AUTH_REDIS_KEY + ":revoked"
+AUTH_USER_CHANGED_CHANNEL = AUTH_REDIS_KEY + ":user_changed"
+AUTH_REVOCATION_LISTENER_RETRY_DELAY = 1  # 1s
+PASSWORD_SCRYPT_N = 2 ** 14
+PASSWORD_SCRYPT_R = 8
+PASSWORD_SCRYPT_P = 1
+PASSWORD_SALT_SIZE = 16
+PASSWORD_HASH_SIZE = 32
 
 # Storage
 STORAGE_REDIS_DB_ID = 1
 STORAGE_CHANNEL_CACHE_SIZE = 1000
+STORAGE_REDIS_BLOCKING_POOL_SIZE = 1000  # Max concurrent BLPOP/XREAD waiters (open listen streams) per worker
+STORAGE_REDIS_USE_BLMPOP = REDIS_USE_BLMPOP
+STORAGE_WRITE_BATCH_MAX = 500  # Max channel messages inserted with a single statement
+STORAGE_DIRECT_COMPRESSION_MIN_SIZE = 4 * 1024  # 4KB. Larger direct messages are stored zlib-compressed
+STORAGE_DIRECT_COMPRESSION_LEVEL = 1
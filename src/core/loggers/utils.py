@@ -10,7 +10,7 @@ def log_async_methods(
         log_level: int = logging.DEBUG
 ):
     """
-    A decorator function for logging all async methods of class.
+    A decorator function for logging all async methods defined on class (inherited ones are left as is).
 
     :param logger_name: `str | None`
         The custom name of the logger, where the logs will be pushed. If not given,
@@ -33,26 +33,30 @@ def log_async_methods(
             logger = logging.getLogger(
                 logger_name if logger_name is not None else f"async_calls.{cls.__module__}.{cls.__name__}")
 
-            @wraps(func)
-            async def wrapper(*args, **kwargs) -> Any:
-                logger.log(log_level, f"Called method {func.__name__} of class {cls.__name__}")
+            async def logged_call(*args, **kwargs) -> Any:
+                logger.log(log_level, "Called method %s of class %s", func.__name__, cls.__name__)
 
                 result = await func(*args, **kwargs)
 
                 if log_result:
-                    logger.log(log_level, f"Got result form method {func.__name__} of class {cls.__name__}: {result}")
+                    logger.log(log_level, "Got result form method %s of class %s: %s", func.__name__, cls.__name__, result)
 
                 return result
 
-            return wrapper
+            # Returns the original coroutine when the level is disabled, so filtered calls cost one level check
+            @inspect.markcoroutinefunction
+            @wraps(func)
+            def wrapper(*args, **kwargs) -> Any:
+                if logger.isEnabledFor(log_level):
+                    return logged_call(*args, **kwargs)
 
-        for attr in dir(cls):
-            if attr.startswith("__"):
-                continue
+                return func(*args, **kwargs)
 
-            value = getattr(cls, attr)
+            return wrapper
 
-            if inspect.iscoroutinefunction(value):
+        # Own namespace only: no MRO walk, and static/class methods (wrapped objects) are skipped instead of being unbound
+        for attr, value in list(vars(cls).items()):
+            if not attr.startswith("__") and inspect.iscoroutinefunction(value):
                 setattr(cls, attr, get_wrapper(value))
 
         return cls
@@ -1,6 +1,7 @@
-import json
 from typing import Any
 
+import orjson
+
 from src.core.state.config.abc import AbstractConfig
 from src.core.utils.collections import DotDict
 
@@ -33,10 +34,10 @@ class JsonFileConfig(AbstractConfig):
             A dictionary containing configuration data.
         """
 
-        with open(self._file_path, "r") as file:
-            data = json.load(file)
+        with open(self._file_path, "rb") as file:
+            data = orjson.loads(file.read())
 
-            if self._use_dotdict:
-                data = DotDict(init_data=data)
+        if self._use_dotdict:
+            data = DotDict(init_data=data)
 
-            return data
+        return data
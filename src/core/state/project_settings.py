@@ -34,6 +34,24 @@ class ProjectSettings:
 
         self._config_data: dict[str, Any] = {}
 
+    def _cache_value(self, item: str, value: Any) -> Any:
+        """
+        Stores a resolved value as a plain instance attribute,
+        so further reads are regular attribute loads that never reach `__getattr__`.
+
+        :param item: `str`
+            The attribute name.
+
+        :param value: `Any`
+            The resolved value.
+
+        :return: `Any`
+            The same value.
+        """
+
+        self.__dict__[item] = value
+        return value
+
     def _get_value_from_config_data(self, item: str) -> Any:
         """
         Retrieves a value from `_config_data`
@@ -51,19 +69,19 @@ class ProjectSettings:
         value = self._config_data[item]
 
         if isinstance(value, AbstractLazyObject):
-            return value.get()
+            return self._cache_value(item, value.get())
         elif isinstance(value, str) and value.startswith(self.__class__.LAZY_OBJECT_PREFIX):
             lazy_object = LazyObject[Any](".".join(value.split(".")[1:]))
             setattr(self, item, lazy_object)
-            return lazy_object.get()
+            return self._cache_value(item, lazy_object.get())
         elif isinstance(value, tuple) and (len(value) != 0 and isinstance(value[0], str) and value[0].startswith(
                 self.__class__.LAZY_INSTANCE_PREFIX)):
             name, *args = value
             lazy_instance = LazyInstance[Any](".".join(name.split(".")[1:]), *args)
             setattr(self, item, lazy_instance)
-            return lazy_instance.get()
+            return self._cache_value(item, lazy_instance.get())
 
-        return value
+        return self._cache_value(item, value)
 
     def __getattr__(self, item: str) -> Any:
         """
@@ -87,7 +105,7 @@ class ProjectSettings:
     def __setattr__(self, key: str, value: Any) -> None:
         """
         Overrides the default `__setattr__` method to handle attribute assignments.
-        Sets the specified attribute `key` to the provided value in the `_config_data`.
+        Sets the specified attribute `key` to the provided value in the `_config_data`, dropping its cached value.
 
         :param key: `str`
             The attribute name.
@@ -99,6 +117,7 @@ class ProjectSettings:
         if key.startswith("_"):
             return super().__setattr__(key, value)
 
+        self.__dict__.pop(key, None)
         self._config_data[key] = value
 
     def get(self, key: str, default: Any = MISSING) -> Any:
@@ -116,10 +135,7 @@ class ProjectSettings:
             Value of attribute or default
         """
 
-        try:
-            return self.__getattr__(key)
-        except AttributeError:
-            return default
+        return getattr(self, key, default)
 
     def register_config(self, config: AbstractConfig) -> None:
         """
@@ -129,7 +145,12 @@ class ProjectSettings:
             The configuration instance.
         """
 
-        self._config_data.update(config.load())
+        config_data = config.load()
+
+        for key in config_data:
+            self.__dict__.pop(key, None)
+
+        self._config_data.update(config_data)
 
     def setup_from_environment(self) -> None:
         """
@@ -1,10 +1,16 @@
 import asyncio
-from collections import defaultdict
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Coroutine, Callable, Any, Iterable
+from typing import Coroutine, Callable, Any, Iterable, Awaitable, Sequence
 
 type CoroOrFuture[_T] = Coroutine[Any, Any, _T] | asyncio.Future[_T]
 
+# Process-wide pool for `run_in_threadpool`, separate from the loop's default executor (used for DNS lookups etc.),
+# so long offloaded work never delays connection setup. Threads are started on demand and kept for reuse
+_threadpool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2), thread_name_prefix="threadpool")
+
 
 async def gather_all[_T](coros_or_futures: Iterable[CoroOrFuture[_T]]) -> tuple[_T, ...]:
     """
@@ -17,7 +23,34 @@ async def gather_all[_T](coros_or_futures: Iterable[CoroOrFuture[_T]]) -> tuple[
         A tuple containing the results of the gathered coroutines or futures.
     """
 
-    return tuple(await asyncio.gather(*coros_or_futures))
+    items = list(coros_or_futures)
+
+    # Already resolved futures need no `gather` (and no extra loop iteration) to collect their results
+    futures = [item for item in items if isinstance(item, asyncio.Future) and item.done()]
+    if len(futures) == len(items):
+        return tuple([future.result() for future in futures])
+
+    # A single awaitable has nothing to run concurrently with, so it is awaited in place without wrapping it in a task
+    if len(items) == 1:
+        return (await items[0],)
+
+    return tuple(await asyncio.gather(*items))
+
+
+def create_detached_task[_T](coro: Coroutine[Any, Any, _T]) -> asyncio.Task[_T]:
+    """
+    Creates a task that starts with an empty context instead of a copy of the caller's one.
+    Used for work shared by several callers or outliving the current one, so it never picks up
+    context-scoped state of whoever happened to spawn it (e.g. the database session of a request).
+
+    :param coro: `Coroutine[Any, Any, _T]`
+        The coroutine to run.
+
+    :return: `asyncio.Task[_T]`
+        The created task.
+    """
+
+    return asyncio.create_task(coro, context=contextvars.Context())
 
 
 async def wait_with_timeout[_T](
@@ -42,7 +75,13 @@ async def wait_with_timeout[_T](
         The result of the coroutine.
     """
 
-    return await asyncio.wait_for(asyncio.shield(coro) if shield else coro, timeout=timeout)
+    awaitable = asyncio.shield(coro) if shield else coro
+
+    # Without a timeout there is nothing for `wait_for` to do (it would still wrap the coroutine in a task)
+    if timeout is None:
+        return await awaitable
+
+    return await asyncio.wait_for(awaitable, timeout=timeout)
 
 
 async def safe_wait_with_timeout[_T](
@@ -67,6 +106,10 @@ async def safe_wait_with_timeout[_T](
         A tuple containing a success flag and the result of the coroutine (or `None` if timed out).
     """
 
+    # Nothing can time out without a timeout
+    if timeout is None:
+        return True, await (asyncio.shield(coro) if shield else coro)
+
     try:
         return True, await wait_with_timeout(coro, timeout=timeout, shield=shield)  # type: ignore
     except asyncio.TimeoutError:
@@ -87,7 +130,7 @@ async def run_in_threadpool[_T](func: Callable[..., _T], *args: object) -> _T:
         The result of the function.
     """
 
-    return await asyncio.get_event_loop().run_in_executor(None, func, *args)
+    return await asyncio.get_running_loop().run_in_executor(_threadpool, func, *args)
 
 
 async def _call_after[_T](
@@ -126,39 +169,85 @@ async def call_after[_T](coro: CoroOrFuture[_T], *, after: float) -> asyncio.Tas
         A task that represents the scheduled coroutine.
     """
 
-    return asyncio.create_task(_call_after(coro, after=after))
+    return create_detached_task(_call_after(coro, after=after))
+
+
+def call_later(func: Callable[..., Any], *args: object, after: float) -> asyncio.TimerHandle:
+    """
+    Schedule a plain (non-async) callback to be called after a specified delay.
+    Unlike `call_after`, no task or coroutine is created: only a timer handle is put on the event loop.
+
+    :param func: `Callable[..., Any]`
+        The callback to call. Its return value is ignored.
+
+    :param args: `tuple`
+        The arguments to pass to the callback.
+
+    :param after: `float`
+        The time in seconds to wait before calling the callback.
+
+    :return: `asyncio.TimerHandle`
+        A handle that can be used to cancel the call.
+    """
+
+    return asyncio.get_running_loop().call_later(after, func, *args)
 
 
 class NamedAsyncEvent:
     def __init__(self) -> None:
-        self._events: defaultdict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        # Events are created by `set` and `wait` only, so probing a name never allocates one
+        self._events: dict[str, asyncio.Event] = {}
+
+    def _get_or_create(self, name: str) -> asyncio.Event:
+        if (event := self._events.get(name)) is None:
+            event = self._events[name] = asyncio.Event()
+
+        return event
 
     def is_set(self, name: str) -> bool:
-        return self._events[name].is_set()
+        return (event := self._events.get(name)) is not None and event.is_set()
 
     def set(self, name: str) -> None:
-        self._events[name].set()
+        self._get_or_create(name).set()
 
     def clear(self, name: str) -> None:
-        self._events[name].clear()
+        if (event := self._events.get(name)) is not None:
+            event.clear()
 
     async def wait(self, name: str) -> None:
-        await self._events[name].wait()
+        await self._get_or_create(name).wait()
 
 
 class NamedAsyncLock:
     def __init__(self) -> None:
-        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Lock and the number of its holders and waiters; the entry is dropped once nobody uses the lock,
+        # so a lock is never replaced while a waiter is still queued on it
+        self._locks: dict[str, tuple[asyncio.Lock, int]] = {}
 
     def is_locked(self, name: str) -> bool:
-        return name in self._locks and self._locks[name].locked()
+        return name in self._locks and self._locks[name][0].locked()
+
+    def _unref(self, name: str) -> None:
+        lock, users = self._locks[name]
+
+        if users == 1:
+            del self._locks[name]
+        else:
+            self._locks[name] = (lock, users - 1)
 
     async def acquire(self, name: str):
-        await self._locks[name].acquire()
+        lock, users = self._locks.get(name) or (asyncio.Lock(), 0)
+        self._locks[name] = (lock, users + 1)
+
+        try:
+            await lock.acquire()  # Returns without suspending when the lock is free
+        except BaseException:
+            self._unref(name)
+            raise
 
     def release(self, name: str) -> None:
-        self._locks[name].release()
-        self._locks.pop(name)
+        self._locks[name][0].release()
+        self._unref(name)
 
     @asynccontextmanager
     async def lock(self, name: str):
@@ -170,3 +259,84 @@ class NamedAsyncLock:
 
     def __call__(self, name: str):
         return self.lock(name)
+
+
+class TickBatcher[_ItemT, _ResultT]:
+    """
+    Collects items submitted within the same event loop tick and processes them with a single batch call.
+
+    The batch callable receives items in submission order and must return one result per item;
+    a returned exception instance is raised to the submitter of the corresponding item only.
+    """
+
+    def __init__(
+            self,
+            process_batch: Callable[[list[_ItemT]], Awaitable[Sequence[_ResultT | BaseException]]],
+            *,
+            max_size: int | None = None
+    ) -> None:
+        """
+        Initializes a TickBatcher with no pending items.
+
+        :param process_batch: `Callable[[list[_ItemT]], Awaitable[Sequence[_ResultT | BaseException]]]`
+            Coroutine function processing a whole batch.
+
+        :param max_size: `int | None`
+            (Optional) Maximum number of items in a single batch. By default, `None` (unlimited).
+        """
+
+        self._process_batch = process_batch
+        self._max_size: int | None = max_size
+        self._pending: list[tuple[_ItemT, asyncio.Future[_ResultT]]] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = create_detached_task(coro)  # A batch belongs to no single submitter
+        self._tasks.add(task)  # Keeps a strong reference until done
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process(self, batch: list[tuple[_ItemT, asyncio.Future[_ResultT]]]) -> None:
+        try:
+            results: Sequence[_ResultT | BaseException] = await self._process_batch([item for item, _ in batch])
+        except Exception as error:
+            results = [error] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():  # Submitter was cancelled
+                continue
+
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+
+        if len(batch) != 0:
+            await self._process(batch)
+
+    async def submit(self, item: _ItemT) -> _ResultT:
+        """
+        Submit an item to the current batch and wait for its result.
+
+        :param item: `_ItemT`
+            The item to process.
+
+        :return: `_ResultT`
+            The result of processing the item.
+        """
+
+        future: asyncio.Future[_ResultT] = asyncio.get_running_loop().create_future()
+
+        # The first submitter of a tick schedules the flush; submitters that follow in the same tick join its batch
+        if len(self._pending) == 0:
+            self._spawn(self._flush())
+
+        self._pending.append((item, future))
+
+        if self._max_size is not None and len(self._pending) >= self._max_size:
+            batch, self._pending = self._pending, []
+            self._spawn(self._process(batch))
+
+        return await future
@@ -1,6 +1,10 @@
 import asyncio
 import json
-from typing import Callable, Iterable, Any
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Hashable, Iterable, Any
+
+_MISSING = object()
 
 
 class DotDict(dict[str, Any]):
@@ -28,14 +32,18 @@ class DotDict(dict[str, Any]):
             WARNING: All values that have type `dict` will be replaced with `DotDict`
         """
 
-        super(DotDict, self).__init__(**(init_data if init_data is not None else {}))
+        super(DotDict, self).__init__()
+        self.__dict__["_replace_with_dotdict"] = replace_with_dotdict
 
-        self._replace_with_dotdict = replace_with_dotdict
+        if init_data is None:
+            return
 
-        if self._replace_with_dotdict:
-            for key, value in self.items():
-                if type(value) is dict:
-                    setattr(self, key, DotDict(value))
+        # Values are converted while being inserted, so every key is written once
+        if replace_with_dotdict:
+            for key, value in init_data.items():
+                dict.__setitem__(self, key, DotDict(value) if type(value) is dict else value)
+        else:
+            super().update(init_data)
 
     @property
     def replace_with_dotdict(self) -> bool:
@@ -78,10 +86,11 @@ class DotDict(dict[str, Any]):
         :raises AttributeError: If the attribute is not found.
         """
 
-        try:
-            return super(DotDict, self).__getitem__(item)
-        except KeyError as error:
-            raise AttributeError(f"{self.__class__.__name__} has no attribute '{item}'") from error
+        # Unbound `dict.get` skips the `super()` proxy, and a miss is detected without raising a KeyError first
+        if (value := dict.get(self, item, _MISSING)) is _MISSING:
+            raise AttributeError(f"{self.__class__.__name__} has no attribute '{item}'")
+
+        return value
 
     def find(self, key: str) -> Any:
         """
@@ -109,7 +118,7 @@ class AsyncObservableMixin[_KT, _VT]:
         """
 
         self._pending: dict[_KT, asyncio.Future[_VT]] = {}
-        self._global_pending: list[asyncio.Future[_VT]] = []
+        self._global_pending: deque[asyncio.Future[_VT]] = deque()
 
     def __contains__(self, item: _KT) -> bool:
         return super().__contains__(item)  # type: ignore
@@ -146,8 +155,9 @@ class AsyncObservableMixin[_KT, _VT]:
             if not future.done():
                 future.set_result(value)
 
-        while self._global_pending:
-            future = self._global_pending.pop(0)
+        # Every global waiter gets the same value, so the queue is swapped out and drained in one pass
+        pending, self._global_pending = self._global_pending, deque()
+        for future in pending:
             if not future.done():
                 future.set_result(value)
 
@@ -197,18 +207,19 @@ class AsyncObservableMixin[_KT, _VT]:
             if filter_func is None or filter_func(value):
                 return value
 
-        future: asyncio.Future[_VT] = asyncio.Future()
-        self._register_future(future, key)
+        # A resolved future can't be reset, so each wait needs a new one; it is created by the loop (native futures)
+        create_future = asyncio.get_running_loop().create_future
+        register_future = self._register_future
 
         async with asyncio.timeout(timeout):
             while True:
+                future: asyncio.Future[_VT] = create_future()
+                register_future(future, key)
+
                 value = await future
                 if filter_func is None or filter_func(value):
                     return value
 
-                future = asyncio.Future()
-                self._register_future(future, key)
-
 
 class AsyncObservableDict[_KT, _VT](AsyncObservableMixin, dict[_KT, _VT]):
     """
@@ -216,9 +227,157 @@ class AsyncObservableDict[_KT, _VT](AsyncObservableMixin, dict[_KT, _VT]):
     """
 
 
+class TTLCache[_KT, _VT]:
+    """
+    A bounded in-memory cache whose entries expire after a fixed time-to-live.
+    When `maxsize` is reached, the least recently used entry is evicted.
+    Entries may be tagged with a group, so related entries can be removed together without a scan.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initializes an empty TTLCache.
+
+        :param maxsize: `int`
+            The maximum number of entries to keep.
+
+        :param ttl: `float`
+            The time-to-live of each entry in seconds.
+
+        :param timer: `Callable[[], float]`
+            (Optional) A monotonic clock used to expire entries. By default, `time.monotonic`.
+        """
+
+        self._maxsize: int = maxsize
+        self._ttl: float = ttl
+        self._timer: Callable[[], float] = timer
+        self._data: OrderedDict[_KT, tuple[float, _VT]] = OrderedDict()
+        self._groups: dict[Hashable, set[_KT]] = {}
+        self._key_groups: dict[_KT, Hashable] = {}
+
+    def _forget_group(self, key: _KT) -> None:
+        if (group := self._key_groups.pop(key, None)) is None:
+            return
+
+        keys = self._groups[group]
+        keys.discard(key)
+        if len(keys) == 0:
+            del self._groups[group]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: _KT) -> bool:
+        return self.get(key, None) is not None
+
+    def get(self, key: _KT, default: _VT | None = None) -> _VT | None:
+        """
+        Returns the cached value for the given key if it is present and not expired.
+
+        :param key: `_KT`
+            The key to look up.
+
+        :param default: `_VT | None`
+            (Optional) The value to return if key is missing or expired. By default, `None`.
+
+        :return: `_VT | None`
+            The cached value or default.
+        """
+
+        if (item := self._data.get(key)) is None:
+            return default
+
+        expires_at, value = item
+        if expires_at <= self._timer():
+            del self._data[key]
+            self._forget_group(key)
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: _KT, value: _VT, ttl: float | None = None, group: Hashable | None = None) -> None:
+        """
+        Stores the value for the given key, evicting the least recently used entry if the cache is full.
+
+        :param key: `_KT`
+            The key to store the value for.
+
+        :param value: `_VT`
+            The value to store.
+
+        :param ttl: `float | None`
+            (Optional) Custom time-to-live for this entry in seconds. By default, the cache ttl is used.
+
+        :param group: `Hashable | None`
+            (Optional) The group to tag this entry with, see `pop_group`. By default, the entry is not grouped.
+        """
+
+        self._data[key] = (self._timer() + (ttl if ttl is not None else self._ttl), value)
+        self._data.move_to_end(key)
+
+        self._forget_group(key)
+        if group is not None:
+            self._key_groups[key] = group
+            self._groups.setdefault(group, set()).add(key)
+
+        while len(self._data) > self._maxsize:
+            evicted_key, _ = self._data.popitem(last=False)
+            self._forget_group(evicted_key)
+
+    def pop(self, key: _KT, default: _VT | None = None) -> _VT | None:
+        """
+        Removes the given key from the cache.
+
+        :param key: `_KT`
+            The key to remove.
+
+        :param default: `_VT | None`
+            (Optional) The value to return if key is missing. By default, `None`.
+
+        :return: `_VT | None`
+            The removed value or default.
+        """
+
+        if (item := self._data.pop(key, None)) is None:
+            return default
+
+        self._forget_group(key)
+        return item[1]
+
+    def pop_group(self, group: Hashable) -> int:
+        """
+        Removes all entries tagged with the given group.
+
+        :param group: `Hashable`
+            The group whose entries should be removed.
+
+        :return: `int`
+            The number of removed entries.
+        """
+
+        if (keys := self._groups.pop(group, None)) is None:
+            return 0
+
+        for key in keys:
+            del self._data[key]
+            del self._key_groups[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+
+        self._data.clear()
+        self._groups.clear()
+        self._key_groups.clear()
+
+
 def find_in_dict[_KT, _VT](dict_: dict[_KT, _VT], key: _KT) -> _VT | None:
     """
-    Recursively searches for a key in a nested dictionary and returns its corresponding value.
+    Searches for a key in a nested dictionary (depth-first) and returns its corresponding value.
 
     :param dict_: `dict[_KT, _VT]`
         The dictionary to search.
@@ -233,9 +392,21 @@ def find_in_dict[_KT, _VT](dict_: dict[_KT, _VT], key: _KT) -> _VT | None:
     if (value := dict_.get(key, None)) is not None:
         return value
 
-    for val in dict_.values():
-        if isinstance(val, dict) and (value := find_in_dict(val, key)) is not None:
-            return value
+    # Stack of value iterators instead of recursion: same visiting order, no frame per level and no recursion limit
+    stack = [iter(dict_.values())]
+
+    while stack:
+        for val in stack[-1]:
+            if isinstance(val, dict):  # Not `type(...) is dict`: nested DotDicts must be searched too
+                if (value := val.get(key, None)) is not None:
+                    return value
+
+                stack.append(iter(val.values()))
+                break
+        else:
+            stack.pop()
+
+    return None
 
 
 def find_in_array[_T](array: Iterable[_T], check: Callable[[_T], bool]) -> _T | None:
@@ -315,7 +486,8 @@ def replace_substring(original_string: str, start_index: int, end_index: int, re
             end_index < 0 or end_index > len(original_string)) or (start_index > end_index):
         raise IndexError("Invalid start or end index.")
 
-    return original_string[:start_index] + replacement_substring + original_string[end_index:]
+    # Single join: no intermediate string for the first concatenation
+    return "".join((original_string[:start_index], replacement_substring, original_string[end_index:]))
 
 
 def for_each[_T](func: Callable, iterable: Iterable[_T]) -> None:
@@ -332,7 +504,7 @@ def for_each[_T](func: Callable, iterable: Iterable[_T]) -> None:
         :raise TypeError: If the provided argument is not iterable.
     """
 
-    tuple(map(func, iterable))
+    deque(map(func, iterable), maxlen=0)  # Exhausts the iterator in C without keeping the results
 
 
 def safe_json(data: str | bytes, **kwargs) -> dict[str, Any] | None:
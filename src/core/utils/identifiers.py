@@ -0,0 +1,17 @@
+import os
+
+
+def generate_uuid_string() -> str:
+    """
+    Generates a random (version 4) UUID string without constructing a `uuid.UUID` object.
+
+    :return: `str`
+        UUID string in canonical 8-4-4-4-12 form.
+    """
+
+    data = bytearray(os.urandom(16))
+    data[6] = (data[6] & 0x0F) | 0x40  # Version 4
+    data[8] = (data[8] & 0x3F) | 0x80  # RFC 4122 variant
+
+    hex_ = data.hex()
+    return f"{hex_[:8]}-{hex_[8:12]}-{hex_[12:16]}-{hex_[16:20]}-{hex_[20:]}"
@@ -2,6 +2,11 @@ import sys
 from importlib import import_module
 from typing import Any
 
+_MISSING = object()
+
+# Objects resolved from fully initialized modules, keyed by (module path, object name)
+_objects_cache: dict[tuple[str, str], Any] = {}
+
 
 def cached_import(module_path: str, object_name: str) -> Any:
     """
@@ -20,6 +25,9 @@ def cached_import(module_path: str, object_name: str) -> Any:
         If the object cannot be found in the module.
     """
 
+    if (obj := _objects_cache.get((module_path, object_name), _MISSING)) is not _MISSING:
+        return obj
+
     # Check whether the module is already loaded and fully initialized
     module = sys.modules.get(module_path)
     spec = getattr(module, "__spec__", None)
@@ -28,10 +36,16 @@ def cached_import(module_path: str, object_name: str) -> Any:
         module = import_module(module_path)
 
     try:
-        return getattr(module, object_name)
+        obj = getattr(module, object_name)
     except AttributeError as error:
         raise ImportError(f"Attribute '{object_name}' is not defined in module '{module_path}'") from error
 
+    # Objects of a module that is still being initialized (circular import) may be rebound later, so they aren't cached
+    if not getattr(module.__spec__, "_initializing", False):
+        _objects_cache[(module_path, object_name)] = obj
+
+    return obj
+
 
 def import_object(object_path: str) -> Any:
     """
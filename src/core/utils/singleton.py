@@ -20,9 +20,11 @@ class SingletonMeta(type):
             Keyword arguments for the class constructor.
         """
 
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # Called on every `XServiceST()` access, so the existing instance is returned after a single dict probe
+        if (instance := cls._instances.get(cls)) is None:
+            instance = cls._instances[cls] = super().__call__(*args, **kwargs)
+
+        return instance
 
 
 class ABCSingletonMeta(ABCMeta, SingletonMeta):
@@ -9,6 +9,33 @@ from src.core.exceptions.generics import NoneObjectError
 _logger = logging.getLogger(__name__)
 
 
+def default[_T](value: _T | None, fallback: _T | None) -> _T:
+    """
+    Returns value if value is not None, in other case returns fallback if it is not None.
+    Single-default version of `default_any` that doesn't pack defaults into a tuple.
+
+    :param value: `_T | None`
+        Initial value
+
+    :param fallback: `_T | None`
+        Default value
+
+    :return: `_T`
+        Returns value if value is not None, in other case returns fallback
+
+    :raises:
+        :raise NoneObjectError: If both value and fallback are None
+    """
+
+    if value is not None:
+        return value
+
+    if fallback is not None:
+        return fallback
+
+    raise NoneObjectError("All default values are None")
+
+
 def default_any[_T](
         value: _T | None,
         *defaults: *tuple[_T, ...]
@@ -60,19 +87,25 @@ def deprecated(
     """
 
     def decorator(func):
+        # The message only depends on the decorated object, so it is built once at decoration time
+        kind = 'class' if inspect.isclass(func) else 'function'
+        msg = reason if isinstance(reason, str) else f"{kind} is deprecated"
+        message = warning_format.format(kind=kind, name=func.__name__, reason=msg)
+        warned = False
+
         @functools.wraps(func)
         def new_func(*args, **kwargs):
-            name = func.__name__
-            kind = 'class' if inspect.isclass(func) else 'function'
-            msg = reason if isinstance(reason, str) else f"{kind} is deprecated"
-
-            warnings.simplefilter('always', DeprecationWarning)
-            warnings.warn(
-                message=warning_format.format(kind=kind, name=name, reason=msg),
-                category=DeprecationWarning,
-                stacklevel=2
-            )
-            warnings.simplefilter('default', DeprecationWarning)
+            nonlocal warned
+
+            # Warned once per deprecated object, global warning filters are left to the application
+            if not warned:
+                warned = True
+
+                warnings.warn(
+                    message=message,
+                    category=DeprecationWarning,
+                    stacklevel=2
+                )
 
             return func(*args, **kwargs)
 
@@ -0,0 +1,9 @@
+import sys
+from unittest import mock
+
+from src.core.state import project_settings, PyModuleConfig
+
+# Only the python config is needed by unit tests (secrets and status codes are loaded by the app itself).
+# It parses the app's command line on import, so pytest's own arguments are hidden from it
+with mock.patch.object(sys, "argv", sys.argv[:1]):
+    project_settings.register_config(PyModuleConfig('src.config'))
@@ -0,0 +1,51 @@
+import hashlib
+
+import pytest
+
+from src.app.main.components.auth.internal_utils.hashers import (
+    SCRYPT_HASH_PREFIX,
+    hash_password,
+    is_legacy_hash,
+    needs_rehash,
+    verify_password
+)
+from src.core.state import project_settings
+
+
+class PTestPasswordHashers:
+    def test_hash_verify_round_trip(self) -> None:
+        password_hash = hash_password("correct horse")
+
+        assert password_hash.startswith(SCRYPT_HASH_PREFIX + "$")
+        assert verify_password("correct horse", password_hash)
+        assert not verify_password("wrong horse", password_hash)
+
+    def test_hashes_are_salted(self) -> None:
+        assert hash_password("correct horse") != hash_password("correct horse")
+
+    def test_legacy_sha256_verification(self) -> None:
+        legacy_hash = hashlib.sha256(b"correct horse").hexdigest()
+
+        assert is_legacy_hash(legacy_hash)
+        assert verify_password("correct horse", legacy_hash)
+        assert not verify_password("wrong horse", legacy_hash)
+        assert needs_rehash(legacy_hash)
+
+    def test_needs_rehash_when_parameters_change(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        password_hash = hash_password("correct horse")
+        assert not needs_rehash(password_hash)
+
+        monkeypatch.setattr(project_settings, "PASSWORD_SCRYPT_N", project_settings.PASSWORD_SCRYPT_N * 2)
+        assert needs_rehash(password_hash)
+        assert verify_password("correct horse", password_hash)  # Old hashes stay valid until rehashed
+
+    @pytest.mark.parametrize("password_hash", [
+        "scrypt$",
+        "scrypt$x$8$1$c2FsdA==$a2V5",
+        "scrypt$16384$8$1$not-base64!$a2V5",
+        "scrypt$16384$8$1$c2FsdA==",
+        "scrypt$16384$8$1$c2FsdA==$a2V5$extra"
+    ])
+    def test_malformed_hash(self, password_hash: str) -> None:
+        assert not verify_password("correct horse", password_hash)
+        assert needs_rehash(password_hash)